@@ -1,27 +1,119 @@
 """
 Main orchestration script for Spotify Charts automation
 """
+import logging
 import os
+import threading
+from logging.handlers import MemoryHandler
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from src.integrations.spotify_client import SpotifyClient
-from src.reporting.table_generator import TableGenerator
-from src.reporting.dashboard_generator import DashboardGenerator
-from src.integrations.google_drive_client import GoogleDriveClient
-from src.integrations.email_client import EmailClient
+from src.utils.helpers import create_process_pool, group_tracks_by_playlist
 from src.core import config
 
 
+def _configure_logging():
+    """
+    Route library warnings through one buffered handler
+
+    Per-track enrichment warnings come from worker threads; buffering them
+    avoids a locked stderr write per record. The buffer is flushed on errors,
+    when full, at the end of the run and at interpreter exit.
+
+    Returns:
+        The MemoryHandler, so main() can flush it
+    """
+    target = logging.StreamHandler()
+    target.setFormatter(logging.Formatter('   %(levelname)s: %(message)s'))
+    handler = MemoryHandler(capacity=1000, flushLevel=logging.ERROR, target=target)
+    root = logging.getLogger()
+    root.setLevel(logging.WARNING)
+    root.addHandler(handler)
+    return handler
+
+
+def _warm_up_drive():
+    """Authenticate with Google Drive in the background while tracks are scraped"""
+    try:
+        from src.integrations.google_drive_client import GoogleDriveClient
+        GoogleDriveClient.warmup()
+    except Exception as e:
+        # Step 3 authenticates again and reports the error properly
+        print(f"   Warning: Google Drive warm-up failed: {e}")
+
+
+def _get_drive_folder(folder_name):
+    """Find or create the Drive folder that reports are uploaded into"""
+    from src.integrations.google_drive_client import GoogleDriveClient
+    return GoogleDriveClient().get_or_create_folder(folder_name)
+
+
+def _upload_when_folder_ready(file_path, folder_future):
+    """Upload a report once the target Drive folder exists"""
+    from src.integrations.google_drive_client import GoogleDriveClient
+    # Report names carry the run timestamp, so a same-name unchanged file can't exist;
+    # skip_if_unchanged would only add a files.list call per upload
+    return GoogleDriveClient().upload_file(file_path, folder_id=folder_future.result())
+
+
+def _send_report_email(tracks, attachments, run_started):
+    """Send the summary email with the generated reports attached"""
+    from src.integrations.email_client import EmailClient
+    email_client = EmailClient()
+    email_subject = f"Spotify Charts - {run_started.strftime('%Y-%m-%d')}"
+
+    # Build format list for email
+    formats_list = []
+    if config.REPORT_CONFIG['formats']['html']:
+        formats_list.append("HTML")
+    if config.REPORT_CONFIG['formats']['pdf']:
+        formats_list.append("PDF")
+    formats_text = " and ".join(formats_list)
+
+    email_body = f"""
+    <html>
+        <body style="font-family: Arial, sans-serif; background-color: #121212; color: #FFFFFF; padding: 20px;">
+            <h2 style="color: #1DB954;">Spotify Charts Update</h2>
+            <p>Your Spotify charts have been generated and uploaded to Google Drive.</p>
+            <p><strong>Total Tracks:</strong> {len(tracks)}</p>
+            <p><strong>Playlists:</strong> {len(config.PLAYLIST_IDS)}</p>
+            <p><strong>Generated:</strong> {run_started.strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p><strong>Formats:</strong> {formats_text}</p>
+            <p>The reports are attached to this email.</p>
+            <p style="margin-top: 20px;">
+                <a href="https://dnhngynops.github.io/spotCharts/" style="color: #1DB954; text-decoration: none;">
+                    View the dashboard for more analytics and insights →
+                </a>
+            </p>
+        </body>
+    </html>
+    """
+    email_client.send_email(
+        subject=email_subject,
+        body=email_body,
+        attachments=attachments
+    )
+
+
 def main():
     """Main execution function"""
+    # One clock reading per run so filenames, the Drive folder and the email agree
+    run_started = datetime.now()
+    log_handler = _configure_logging()
     print("Starting Spotify Charts automation...")
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Time: {run_started.strftime('%Y-%m-%d %H:%M:%S')}")
     
     try:
+        # Load/refresh Drive credentials off the critical path; scraping takes far longer
+        threading.Thread(target=_warm_up_drive, name='drive-warmup', daemon=True).start()
+
         # Step 1: Collect tracks from Spotify playlists using Selenium + API enrichment
         print("\n1. Collecting tracks from Spotify playlists...")
         print("   Using Selenium scraping (primary) + Spotify API enrichment")
         # Use headless mode to run browser invisibly (faster and no visible window)
         # API enrichment is enabled by default to add metadata like popularity, preview URLs, etc.
+        # Heavy integrations (Selenium, WeasyPrint, Google API, Jinja2) are imported
+        # only when the step that needs them runs
+        from src.integrations.spotify_client import SpotifyClient
         with SpotifyClient(use_api_enrichment=True, headless=True) as spotify_client:
             tracks = spotify_client.get_all_playlist_tracks(config.PLAYLIST_IDS)
             print(f"   ✓ Collected {len(tracks)} tracks across {len(config.PLAYLIST_IDS)} playlists")
@@ -30,13 +122,12 @@ def main():
             print("   No tracks found. Exiting.")
             return
 
+        # Group tracks by playlist (once; reused for the debug listing and the reports)
+        tracks_by_playlist = group_tracks_by_playlist(tracks)
+
         # DEBUG: Print first 3 tracks from each playlist
         print("\n   === DEBUG: First 3 tracks from each playlist ===")
-        from collections import defaultdict
-        debug_tracks_by_playlist = defaultdict(list)
-        for t in tracks:
-            debug_tracks_by_playlist[t.get('playlist', 'Unknown')].append(t)
-        for pname, ptracks in debug_tracks_by_playlist.items():
+        for pname, ptracks in tracks_by_playlist.items():
             print(f"   {pname}:")
             for t in sorted(ptracks, key=lambda x: x.get('position', 999))[:3]:
                 print(f"      #{t.get('position', '?')}: {t.get('track_name', 'Unknown')} - {t.get('artist', 'Unknown')}")
@@ -44,114 +135,114 @@ def main():
 
         # Step 2: Generate reports
         print("\n2. Generating reports...")
-        table_generator = TableGenerator()
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = run_started.strftime('%Y%m%d_%H%M%S')
+
+        if not any(config.REPORT_CONFIG['formats'].values()):
+            print("   Warning: No report formats enabled in configuration")
+            return
 
         # Create output directory if needed
         output_dir = config.REPORT_CONFIG['output_dir']
         os.makedirs(output_dir, exist_ok=True)
 
-        generated_files = []
+        print(f"   Grouped tracks into {len(tracks_by_playlist)} playlists")
 
-        # Group tracks by playlist
-        from collections import defaultdict
-        tracks_by_playlist = defaultdict(list)
-        for track in tracks:
-            playlist_name = track.get('playlist', 'Unknown Playlist')
-            tracks_by_playlist[playlist_name].append(track)
+        # Prepare the Drive date folder in the background and upload each report as
+        # soon as it is written, so Step 3 overlaps with report rendering
+        date_folder_name = run_started.strftime('%Y-%m-%d')
+        upload_executor = ThreadPoolExecutor(max_workers=8)
+        email_executor = ThreadPoolExecutor(max_workers=1)
+        folder_future = upload_executor.submit(_get_drive_folder, date_folder_name)
+        upload_futures = {}
 
-        print(f"   Grouped tracks into {len(tracks_by_playlist)} playlists")
+        def queue_upload(file_path):
+            upload_futures[file_path] = upload_executor.submit(
+                _upload_when_folder_ready, file_path, folder_future
+            )
+
+        try:
+            pdf_executor = None
+            pdf_futures = {}
+            pdf_paths = {}
+            html_file_path = None
 
-        # Generate HTML dashboard with cross-playlist analytics
-        if config.REPORT_CONFIG['formats']['html']:
-            print("   Generating HTML dashboard with analytics...")
-            dashboard_generator = DashboardGenerator()
-            html_filename = f'spotify_charts_dashboard_{timestamp}.html'
-            html_file_path = os.path.join(output_dir, html_filename)
-            dashboard_generator.generate_dashboard(tracks, html_file_path)
-            generated_files.append(html_file_path)
-            print(f"   ✓ HTML dashboard saved to: {html_file_path}")
-
-        # Generate separate PDF for each playlist if configured
-        if config.REPORT_CONFIG['formats']['pdf']:
-            print("   Generating PDF reports (one per playlist)...")
-
-            for playlist_name, playlist_tracks in tracks_by_playlist.items():
-                # Sanitize playlist name for filename
-                safe_name = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in playlist_name)
-                safe_name = safe_name.strip().replace(' ', '_')
-
-                pdf_filename = f'{safe_name}_{timestamp}.pdf'
-                pdf_file_path = table_generator.generate_pdf(
-                    playlist_tracks,
-                    pdf_filename,
-                    playlist_name=playlist_name
+            # Start PDF rendering first so the workers run while the dashboard is built
+            if config.REPORT_CONFIG['formats']['pdf']:
+                print("   Generating PDF reports (one per playlist)...")
+
+                from src.reporting.table_generator import render_playlist_pdf
+
+                # PDF rendering is CPU-bound, so fan the playlists out across processes.
+                # Drive threads are already running, so workers come from a forkserver
+                # (not a fork of this process); it loads WeasyPrint once for all of them.
+                max_workers = min(4, os.cpu_count() or 1, len(tracks_by_playlist))
+                pdf_executor = create_process_pool(
+                    max_workers,
+                    preload=['src.reporting.table_generator', 'src.reporting.pdf_generator']
                 )
-                generated_files.append(pdf_file_path)
-                print(f"   ✓ PDF for '{playlist_name}': {pdf_file_path} ({len(playlist_tracks)} tracks, single continuous page)")
+                pdf_futures = {
+                    pdf_executor.submit(render_playlist_pdf, playlist_name, playlist_tracks, timestamp): playlist_name
+                    for playlist_name, playlist_tracks in tracks_by_playlist.items()
+                }
 
-        if not generated_files:
-            print("   Warning: No report formats enabled in configuration")
-            return
+            try:
+                # Generate HTML dashboard with cross-playlist analytics
+                # (DashboardGenerator only reads the track dicts, so this is safe while
+                # the PDF jobs are still being handed to the worker processes)
+                if config.REPORT_CONFIG['formats']['html']:
+                    print("   Generating HTML dashboard with analytics...")
+                    from src.reporting.dashboard_generator import DashboardGenerator
+                    dashboard_generator = DashboardGenerator()
+                    html_filename = f'spotify_charts_dashboard_{timestamp}.html'
+                    html_file_path = os.path.join(output_dir, html_filename)
+                    dashboard_generator.generate_dashboard(tracks, html_file_path)
+                    queue_upload(html_file_path)
+                    print(f"   ✓ HTML dashboard saved to: {html_file_path}")
 
-        # Step 3: Upload to Google Drive
-        print("\n3. Uploading to Google Drive...")
-        uploaded_file_ids = []
-        try:
-            drive_client = GoogleDriveClient()
-
-            # Create date-based folder (e.g., "2026-01-12")
-            date_folder_name = datetime.now().strftime('%Y-%m-%d')
-            print(f"   Creating/finding date folder: {date_folder_name}")
-            date_folder_id = drive_client.get_or_create_folder(date_folder_name)
-            print(f"   ✓ Date folder ready (ID: {date_folder_id})")
-
-            # Upload files to the date folder
-            for file_path in generated_files:
-                file_id = drive_client.upload_file(file_path, folder_id=date_folder_id)
-                uploaded_file_ids.append(file_id)
-                print(f"   ✓ Uploaded {os.path.basename(file_path)} (ID: {file_id})")
-        except Exception as e:
-            print(f"   Warning: Failed to upload to Google Drive: {e}")
-            print("   Continuing with email notification...")
+                # Collect PDFs as they finish; uploads start immediately
+                for future in as_completed(pdf_futures):
+                    playlist_name = pdf_futures[future]
+                    pdf_file_path = future.result()
+                    pdf_paths[playlist_name] = pdf_file_path
+                    queue_upload(pdf_file_path)
+                    print(f"   ✓ PDF for '{playlist_name}': {pdf_file_path} ({len(tracks_by_playlist[playlist_name])} tracks, single continuous page)")
+            finally:
+                if pdf_executor is not None:
+                    pdf_executor.shutdown(wait=True)
 
-        # Step 4: Send email notification
-        print("\n4. Sending email notification...")
-        try:
-            email_client = EmailClient()
-            email_subject = f"Spotify Charts - {datetime.now().strftime('%Y-%m-%d')}"
+            # Keep attachments in a stable order: dashboard first, then playlist order
+            generated_files = [html_file_path] if html_file_path else []
+            generated_files.extend(pdf_paths[name] for name in tracks_by_playlist if name in pdf_paths)
 
-            # Build format list for email
-            formats_list = []
-            if config.REPORT_CONFIG['formats']['html']:
-                formats_list.append("HTML")
-            if config.REPORT_CONFIG['formats']['pdf']:
-                formats_list.append("PDF")
-            formats_text = " and ".join(formats_list)
-
-            email_body = f"""
-            <html>
-                <body style="font-family: Arial, sans-serif; background-color: #121212; color: #FFFFFF; padding: 20px;">
-                    <h2 style="color: #1DB954;">Spotify Charts Update</h2>
-                    <p>Your Spotify charts have been generated and uploaded to Google Drive.</p>
-                    <p><strong>Total Tracks:</strong> {len(tracks)}</p>
-                    <p><strong>Playlists:</strong> {len(config.PLAYLIST_IDS)}</p>
-                    <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                    <p><strong>Formats:</strong> {formats_text}</p>
-                    <p>The reports are attached to this email.</p>
-                    <p style="margin-top: 20px;">
-                        <a href="https://dnhngynops.github.io/spotCharts/" style="color: #1DB954; text-decoration: none;">
-                            View the dashboard for more analytics and insights →
-                        </a>
-                    </p>
-                </body>
-            </html>
-            """
-            email_client.send_email(
-                subject=email_subject,
-                body=email_body,
-                attachments=generated_files
+            # The email only needs the local report files, so send it while the
+            # Drive uploads finish instead of after them
+            email_future = email_executor.submit(
+                _send_report_email, tracks, generated_files, run_started
             )
+
+            # Step 3: Upload to Google Drive
+            print("\n3. Uploading to Google Drive...")
+            uploaded_file_ids = []
+            try:
+                print(f"   Creating/finding date folder: {date_folder_name}")
+                date_folder_id = folder_future.result()
+                print(f"   ✓ Date folder ready (ID: {date_folder_id})")
+
+                for file_path in generated_files:
+                    file_id = upload_futures[file_path].result()
+                    uploaded_file_ids.append(file_id)
+                    print(f"   ✓ Uploaded {os.path.basename(file_path)} (ID: {file_id})")
+            except Exception as e:
+                print(f"   Warning: Failed to upload to Google Drive: {e}")
+                print("   Continuing with email notification...")
+        finally:
+            upload_executor.shutdown(wait=True)
+            email_executor.shutdown(wait=True)
+
+        # Step 4: Send email notification (sent in the background during Step 3)
+        print("\n4. Sending email notification...")
+        try:
+            email_future.result()
             print("   ✓ Email sent successfully")
         except Exception as e:
             print(f"   Warning: Failed to send email: {e}")
@@ -166,6 +257,8 @@ def main():
     except Exception as e:
         print(f"\n✗ Error during automation: {e}")
         raise
+    finally:
+        log_handler.flush()
 
 
 if __name__ == '__main__':
@@ -2,18 +2,21 @@
 Script to generate PDF reports for all 4 playlists with consistent title sizing
 """
 import os
+from concurrent.futures import as_completed
 from datetime import datetime
 from src.integrations.spotify_client import SpotifyClient
-from src.reporting.table_generator import TableGenerator
+from src.reporting.table_generator import render_playlist_pdf
+from src.utils.helpers import create_process_pool, group_tracks_by_playlist
 from src.core import config
 
 
 def main():
     """Generate PDFs for all playlists"""
+    run_started = datetime.now()
     print("=" * 80)
     print("Generating PDF Reports for All Playlists")
     print("=" * 80)
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    print(f"Time: {run_started.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
     try:
         # Step 1: Collect tracks from all playlists
@@ -34,11 +37,7 @@ def main():
         print("=" * 80)
 
         # Group tracks by playlist
-        from collections import defaultdict
-        tracks_by_playlist = defaultdict(list)
-        for track in tracks:
-            playlist_name = track.get('playlist', 'Unknown Playlist')
-            tracks_by_playlist[playlist_name].append(track)
+        tracks_by_playlist = group_tracks_by_playlist(tracks)
 
         print(f"\nGrouped tracks into {len(tracks_by_playlist)} playlists\n")
 
@@ -46,30 +45,32 @@ def main():
         output_dir = config.REPORT_CONFIG['output_dir']
         os.makedirs(output_dir, exist_ok=True)
 
-        # Generate PDF for each playlist
-        table_generator = TableGenerator()
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        generated_pdfs = []
-
-        for playlist_name, playlist_tracks in tracks_by_playlist.items():
-            # Sanitize playlist name for filename
-            safe_name = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in playlist_name)
-            safe_name = safe_name.strip().replace(' ', '_')
-
-            pdf_filename = f'{safe_name}_{timestamp}.pdf'
-            pdf_file_path = table_generator.generate_pdf(
-                playlist_tracks,
-                pdf_filename,
-                playlist_name=playlist_name
-            )
-            generated_pdfs.append(pdf_file_path)
-            
-            file_size_kb = os.path.getsize(pdf_file_path) / 1024
-            print(f"✓ PDF for '{playlist_name}': {pdf_file_path}")
-            print(f"  - Tracks: {len(playlist_tracks)}")
-            print(f"  - Size: {file_size_kb:.1f} KB")
-            print(f"  - Format: Single continuous page")
-            print()
+        # Generate PDF for each playlist in parallel (rendering is CPU-bound)
+        timestamp = run_started.strftime('%Y%m%d_%H%M%S')
+        pdf_paths = {}
+
+        max_workers = min(4, os.cpu_count() or 1, len(tracks_by_playlist))
+        # Workers start from a forkserver that loads WeasyPrint once; forking this
+        # process could inherit locks held by the API client's threads
+        worker_modules = ['src.reporting.table_generator', 'src.reporting.pdf_generator']
+        with create_process_pool(max_workers, preload=worker_modules) as executor:
+            futures = {
+                executor.submit(render_playlist_pdf, playlist_name, playlist_tracks, timestamp): playlist_name
+                for playlist_name, playlist_tracks in tracks_by_playlist.items()
+            }
+            for future in as_completed(futures):
+                playlist_name = futures[future]
+                pdf_file_path = future.result()
+                pdf_paths[playlist_name] = pdf_file_path
+
+                file_size_kb = os.path.getsize(pdf_file_path) / 1024
+                print(f"✓ PDF for '{playlist_name}': {pdf_file_path}")
+                print(f"  - Tracks: {len(tracks_by_playlist[playlist_name])}")
+                print(f"  - Size: {file_size_kb:.1f} KB")
+                print(f"  - Format: Single continuous page")
+                print()
+
+        generated_pdfs = [pdf_paths[name] for name in tracks_by_playlist if name in pdf_paths]
 
         print("=" * 80)
         print("✓ All PDFs generated successfully!")
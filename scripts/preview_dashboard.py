@@ -9,6 +9,11 @@ import json
 import subprocess
 from datetime import datetime
 
+try:
+    import orjson  # Optional: much faster (de)serialization of the track cache
+except ImportError:
+    orjson = None
+
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -19,15 +24,20 @@ OUTPUT_DIR = './output'
 def load_cached_tracks():
     """Load tracks from cache if available"""
     if os.path.exists(CACHE_FILE):
-        with open(CACHE_FILE, 'r') as f:
-            return json.load(f)
+        with open(CACHE_FILE, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if orjson else json.loads(data)
     return None
 
 def save_tracks_to_cache(tracks):
     """Save tracks to cache for future use"""
     os.makedirs(OUTPUT_DIR, exist_ok=True)
-    with open(CACHE_FILE, 'w') as f:
-        json.dump(tracks, f)
+    if orjson:
+        with open(CACHE_FILE, 'wb') as f:
+            f.write(orjson.dumps(tracks))
+    else:
+        with open(CACHE_FILE, 'w') as f:
+            json.dump(tracks, f)
     print(f"   ✓ Cached {len(tracks)} tracks for future previews")
 
 def collect_fresh_tracks():
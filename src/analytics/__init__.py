@@ -1,5 +1,10 @@
 """
 Analytics and data processing modules
+
+The modules in this package are roadmap placeholders (their methods raise
+NotImplementedError). Nothing in the pipeline imports them, and they are
+deliberately not re-exported here, so they add no import-time cost. Wire
+them in only once they have real implementations.
 """
 # Future implementations will be imported here
 # from .track_analytics import TrackAnalytics
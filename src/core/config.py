@@ -20,7 +20,7 @@ EMAIL_SMTP_PORT = int(os.getenv('EMAIL_SMTP_PORT', '587'))
 EMAIL_USERNAME = os.getenv('EMAIL_USERNAME')
 EMAIL_PASSWORD = os.getenv('EMAIL_PASSWORD')
 EMAIL_FROM = os.getenv('EMAIL_FROM')
-EMAIL_TO = os.getenv('EMAIL_TO', '').split(',') if os.getenv('EMAIL_TO') else []
+EMAIL_TO = [email.strip() for email in os.getenv('EMAIL_TO', '').split(',') if email.strip()]  # Comma-separated
 
 # Playlist Configuration (4 editorial playlists)
 PLAYLIST_IDS = [
@@ -58,5 +58,22 @@ REPORT_CONFIG = {
         'pdf': os.getenv('GENERATE_PDF', 'true').lower() == 'true',    # Generate PDF reports (always single continuous page)
     },
     'output_dir': os.getenv('OUTPUT_DIR', './output'),  # Directory for generated reports
+    # Load templates from a precompiled zip (python -m src.reporting.template_loader)
+    'precompile_templates': os.getenv('PRECOMPILE_TEMPLATES', 'false').lower() == 'true',
 }
 
+# Selenium Scraper Configuration
+SCRAPER_CONFIG = {
+    # Playlists scraped in parallel, each in its own browser process (1 = one shared browser)
+    'playlist_workers': max(1, int(os.getenv('SCRAPER_WORKERS', '1'))),
+}
+
+# Spotify API Metadata Cache Configuration
+CACHE_CONFIG = {
+    'enabled': os.getenv('METADATA_CACHE', 'true').lower() == 'true',  # Reuse API track metadata across runs
+    'path': os.path.join(os.getenv('CACHE_DIR', './data/cache'), 'spotify_tracks.json'),
+    'artist_path': os.path.join(os.getenv('CACHE_DIR', './data/cache'), 'spotify_artists.json'),
+    'static_ttl_hours': 7 * 24,     # Album, artists, duration rarely change
+    'popularity_ttl_hours': 12,     # Popularity shifts daily
+    'genre_ttl_hours': 7 * 24,      # Artist genres change rarely
+}
@@ -1,8 +1,21 @@
 """
 External service integrations (Spotify, Google Drive, Email)
+
+Clients are imported on first access, so importing one integration module does
+not load the others' dependencies (spotipy, Google API client, SMTP).
 """
-from .spotify_client import SpotifyClient
-from .google_drive_client import GoogleDriveClient
-from .email_client import EmailClient
+from importlib import import_module
+
+_CLIENT_MODULES = {
+    'SpotifyClient': '.spotify_client',
+    'GoogleDriveClient': '.google_drive_client',
+    'EmailClient': '.email_client',
+}
+
+__all__ = list(_CLIENT_MODULES)
+
 
-__all__ = ['SpotifyClient', 'GoogleDriveClient', 'EmailClient']
+def __getattr__(name):
+    if name in _CLIENT_MODULES:
+        return getattr(import_module(_CLIENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
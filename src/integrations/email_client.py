@@ -1,11 +1,11 @@
 """
 Email client for sending notifications with attachments
 """
+import base64
 import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
-from email import encoders
 import os
 from src.core import config
 from typing import List
@@ -26,6 +26,35 @@ class EmailClient:
         self.from_email = config.EMAIL_FROM or config.EMAIL_USERNAME
         self.to_emails = config.EMAIL_TO
     
+    # 57 raw bytes encode to one 76-char base64 line, so whole-line chunks
+    # concatenate to exactly what encoders.encode_base64 would produce
+    _ATTACHMENT_CHUNK_SIZE = 57 * 1024
+
+    def _encode_attachment(self, file_path: str) -> MIMEBase:
+        """
+        Build a base64-encoded MIME part for a file, reading it in chunks
+
+        Avoids holding the raw file and its encoded copy in memory at once.
+
+        Args:
+            file_path: Path of the file to attach
+
+        Returns:
+            MIMEBase part with base64 payload and Content-Transfer-Encoding set
+        """
+        encoded_chunks = []
+        with open(file_path, 'rb') as attachment:
+            while True:
+                chunk = attachment.read(self._ATTACHMENT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                encoded_chunks.append(base64.encodebytes(chunk).decode('ascii'))
+
+        part = MIMEBase('application', 'octet-stream')
+        part.set_payload(''.join(encoded_chunks))
+        part['Content-Transfer-Encoding'] = 'base64'
+        return part
+    
     def send_email(self, subject: str, body: str, attachments: List[str] = None, to_emails: List[str] = None):
         """
         Send an email with optional attachments
@@ -55,11 +84,7 @@ class EmailClient:
         if attachments:
             for file_path in attachments:
                 if os.path.exists(file_path):
-                    with open(file_path, 'rb') as attachment:
-                        part = MIMEBase('application', 'octet-stream')
-                        part.set_payload(attachment.read())
-                    
-                    encoders.encode_base64(part)
+                    part = self._encode_attachment(file_path)
                     part.add_header(
                         'Content-Disposition',
                         f'attachment; filename= {os.path.basename(file_path)}'
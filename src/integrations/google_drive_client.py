@@ -1,20 +1,180 @@
 """
 Google Drive API client for uploading files
 """
+import hashlib
+import json
+import logging
+import mimetypes
 import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaIoBaseUpload, build_http, set_user_agent
 from googleapiclient.errors import HttpError
-import pickle
 from src.core import config
 
 
+LOGGER = logging.getLogger(__name__)
+
 # Scopes required for Google Drive API
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
+# Authenticated credentials and Drive services shared across client instances.
+# Credentials are keyed by (credentials_path, token_path); services are also keyed
+# by thread because googleapiclient/httplib2 objects are not thread-safe.
+_AUTH_CACHE_LOCK = threading.Lock()
+_CREDENTIALS_CACHE = {}
+_SERVICE_CACHE = {}
+_REFRESHER_THREADS = {}
+
+# Refresh cached credentials this many seconds before they expire
+TOKEN_REFRESH_MARGIN = 5 * 60
+
+# Folder IDs by (folder_name, parent_folder_id) -> (folder_id, cached_at). Only
+# found/created folders are cached, so a miss always re-checks Drive.
+_FOLDER_CACHE_LOCK = threading.Lock()
+_FOLDER_CACHE = {}
+FOLDER_CACHE_TTL = 600
+
+# Socket timeout (seconds) for Drive API connections
+HTTP_TIMEOUT = 30
+
+# Identifies this app in Drive API request logs
+USER_AGENT = 'spotCharts'
+
+# Files smaller than this are sent as a single multipart request; larger files
+# use a resumable session streamed in one request
+RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+
+# Files at least this large are sent in chunks so a dropped connection only
+# re-sends the current chunk instead of restarting the whole upload
+CHUNKED_UPLOAD_THRESHOLD = 256 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024  # Must be a multiple of 256 KiB
+
+# Drive allows roughly 10 write requests per second per user; stay a little below
+WRITE_REQUESTS_PER_SECOND = 8
+WRITE_BURST = 10
+
+# After a rate-limit response, run at half rate for this many seconds
+RATE_LIMIT_PENALTY_SECONDS = 30
+
+# Retries for uploads rejected with a rate-limit error (403/429)
+MAX_UPLOAD_RETRIES = 5
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket for pacing Drive write requests
+
+    Allows bursts up to `capacity` and a sustained `rate` per second.
+    penalize() halves the rate for a while after the server pushes back, so
+    concurrent workers slow down together instead of retrying into more 403s.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._penalty_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add tokens for elapsed time and lift an expired penalty (lock held)"""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._penalty_until and now >= self._penalty_until:
+            self.rate = self.base_rate
+            self._penalty_until = 0.0
+
+    def acquire(self):
+        """Block until one request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+    def penalize(self, duration: float = RATE_LIMIT_PENALTY_SECONDS):
+        """Halve the rate (down to 1/s) for `duration` seconds"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.rate / 2, 1.0)
+            self._penalty_until = now + duration
+
+
+# Shared by every client and thread: the quota is per user, not per connection
+_WRITE_BUCKET = TokenBucket(WRITE_REQUESTS_PER_SECOND, WRITE_BURST)
+
+
+def _escape_query_value(value: str) -> str:
+    """Escape a value for use inside a quoted Drive files.list query string"""
+    return value.replace('\\', '\\\\').replace("'", "\\'")
+
+
+def _save_token(creds, token_path: str):
+    """Persist credentials as authorized-user JSON so the next run can reuse them"""
+    os.makedirs(os.path.dirname(token_path), exist_ok=True)
+    with open(token_path, 'w') as token:
+        token.write(creds.to_json())
+
+
+def _migrate_pickle_token(token_path: str):
+    """One-time conversion of a legacy token.pickle next to token_path into JSON"""
+    legacy_path = os.path.join(os.path.dirname(token_path), 'token.pickle')
+    if os.path.exists(token_path) or not os.path.exists(legacy_path):
+        return
+
+    import pickle
+    with open(legacy_path, 'rb') as token:
+        creds = pickle.load(token)
+    _save_token(creds, token_path)
+    os.remove(legacy_path)
+    LOGGER.info("Migrated Google Drive token from %s to %s", legacy_path, token_path)
+
+
+def _refresh_credentials_in_background(cache_key, token_path: str):
+    """
+    Keep cached credentials fresh ahead of expiry (runs on a daemon thread)
+
+    Sleeps until TOKEN_REFRESH_MARGIN before the access token expires, then
+    refreshes it in place, so uploads never pay the OAuth round-trip inline.
+    Every cached service shares the same Credentials object and sees the new token.
+    """
+    while True:
+        with _AUTH_CACHE_LOCK:
+            creds = _CREDENTIALS_CACHE.get(cache_key)
+        if creds is None or not creds.refresh_token or creds.expiry is None:
+            return
+
+        # google-auth stores expiry as naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        delay = (creds.expiry - now).total_seconds() - TOKEN_REFRESH_MARGIN
+        if delay > 0:
+            time.sleep(delay)
+
+        try:
+            with _AUTH_CACHE_LOCK:
+                creds.refresh(Request())
+                _save_token(creds, token_path)
+        except Exception as e:
+            LOGGER.warning("Background Google Drive token refresh failed: %s", e)
+            time.sleep(60)
+
 
 class GoogleDriveClient:
     """Client for interacting with Google Drive API"""
@@ -22,22 +182,105 @@ class GoogleDriveClient:
     def __init__(self):
         """Initialize Google Drive client with authentication"""
         self.credentials_path = config.GOOGLE_DRIVE_CREDENTIALS_PATH
-        self.token_path = os.path.join(os.path.dirname(self.credentials_path), 'token.pickle')
-        self.service = self._authenticate()
+        self.token_path = os.path.join(os.path.dirname(self.credentials_path), 'token.json')
+        # Services are built per thread on first use (see service)
+        self._get_credentials()
+
+    @classmethod
+    def warmup(cls) -> 'GoogleDriveClient':
+        """
+        Load the shared credentials ahead of the first real request
+
+        Loads (and if needed refreshes) the process-wide credentials, so later
+        clients on any thread skip the token file read and refresh round trip.
+        No service or connection is built: those are per thread, and one opened
+        on the warm-up thread would never be reused.
+
+        Returns:
+            The warmed-up client
+        """
+        return cls()
+
+    @property
+    def service(self):
+        """
+        Drive service for the calling thread
+
+        googleapiclient services are not thread-safe, so each thread gets its own
+        (cached) service; this makes a single client safe to share across threads.
+        """
+        return self._authenticate()
     
+    def _get_credentials(self) -> Credentials:
+        """
+        Get the shared credentials, loading them from disk once per process
+
+        The first load also starts the background token refresher.
+        """
+        cache_key = (self.credentials_path, self.token_path)
+        with _AUTH_CACHE_LOCK:
+            creds = _CREDENTIALS_CACHE.get(cache_key)
+            if creds is None:
+                creds = _CREDENTIALS_CACHE[cache_key] = self._load_credentials()
+                refresher = threading.Thread(
+                    target=_refresh_credentials_in_background,
+                    args=(cache_key, self.token_path),
+                    name='drive-token-refresher',
+                    daemon=True
+                )
+                _REFRESHER_THREADS[cache_key] = refresher
+                refresher.start()
+        return creds
+
     def _authenticate(self):
-        """Authenticate and return Google Drive service"""
+        """
+        Authenticate and return Google Drive service
+
+        Credentials are loaded from disk once per process and the built service is
+        reused by later instances on the same thread. The service shares the cached
+        Credentials object, whose transport refreshes it in place when it expires.
+        """
+        creds = self._get_credentials()
+        cache_key = (self.credentials_path, self.token_path)
+
+        # Services are per-thread, so only this thread can build or read this entry
+        service_key = cache_key + (threading.get_ident(),)
+        service = _SERVICE_CACHE.get(service_key)
+        if service is None:
+            # One keep-alive connection per thread, shared by metadata calls and media
+            # uploads. build_http() keeps 308 out of the redirect codes for resumable uploads.
+            http = build_http()
+            http.timeout = HTTP_TIMEOUT
+            # googleapiclient appends "(gzip)" to this, which Google requires
+            # (with Accept-Encoding: gzip) before it compresses responses
+            http = set_user_agent(http, USER_AGENT)
+            # static_discovery loads the Drive v3 discovery document bundled with
+            # google-api-python-client instead of fetching it over HTTPS
+            service = build(
+                'drive', 'v3',
+                http=AuthorizedHttp(creds, http=http),
+                cache_discovery=False,
+                static_discovery=True
+            )
+            _SERVICE_CACHE[service_key] = service
+        return service
+
+    def _load_credentials(self):
+        """Load, refresh or obtain OAuth credentials for the Drive API"""
         creds = None
+        token_changed = False
         
         # Load existing token if available
+        _migrate_pickle_token(self.token_path)
         if os.path.exists(self.token_path):
-            with open(self.token_path, 'rb') as token:
-                creds = pickle.load(token)
+            with open(self.token_path, 'r') as token:
+                creds = Credentials.from_authorized_user_info(json.load(token), SCOPES)
         
         # If there are no (valid) credentials available, let the user log in
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
                 creds.refresh(Request())
+                token_changed = True
             else:
                 if not os.path.exists(self.credentials_path):
                     raise FileNotFoundError(
@@ -48,13 +291,14 @@ class GoogleDriveClient:
                 flow = InstalledAppFlow.from_client_secrets_file(
                     self.credentials_path, SCOPES)
                 creds = flow.run_local_server(port=0)
-            
-            # Save credentials for next run
-            os.makedirs(os.path.dirname(self.token_path), exist_ok=True)
-            with open(self.token_path, 'wb') as token:
-                pickle.dump(creds, token)
+                token_changed = True
+        
+        # Only rewrite the token file after a refresh or a new login; a still-valid
+        # token is used as loaded, with no directory or file writes
+        if token_changed:
+            _save_token(creds, self.token_path)
         
-        return build('drive', 'v3', credentials=creds)
+        return creds
     
     def create_folder(self, folder_name: str, parent_folder_id: str = None) -> str:
         """
@@ -77,17 +321,48 @@ class GoogleDriveClient:
         if parent_folder_id:
             file_metadata['parents'] = [parent_folder_id]
 
+        _WRITE_BUCKET.acquire()
         try:
             folder = self.service.files().create(
                 body=file_metadata,
                 fields='id'
             ).execute()
 
+            self._cache_folder_id(folder_name, parent_folder_id, folder.get('id'))
             return folder.get('id')
         except HttpError as error:
-            print(f"An error occurred while creating folder: {error}")
+            if self._is_rate_limited(error):
+                _WRITE_BUCKET.penalize()
+            LOGGER.error("create_folder failed name=%s parent=%s: %s", folder_name, parent_folder_id, error)
             raise
 
+    @staticmethod
+    def _cached_folder_id(folder_name: str, parent_folder_id: str = None) -> str:
+        """Return a cached folder ID if it is still within FOLDER_CACHE_TTL"""
+        with _FOLDER_CACHE_LOCK:
+            entry = _FOLDER_CACHE.get((folder_name, parent_folder_id))
+        if entry and time.monotonic() - entry[1] < FOLDER_CACHE_TTL:
+            return entry[0]
+        return None
+
+    @staticmethod
+    def _cache_folder_id(folder_name: str, parent_folder_id: str, folder_id: str):
+        """Remember a folder ID found in or created on Drive"""
+        if folder_id:
+            with _FOLDER_CACHE_LOCK:
+                _FOLDER_CACHE[(folder_name, parent_folder_id)] = (folder_id, time.monotonic())
+
+    @staticmethod
+    def _folder_query(folder_name: str, parent_folder_id: str = None) -> str:
+        """Build the files.list query that matches a folder by name"""
+        query = (
+            f"name='{_escape_query_value(folder_name)}' "
+            "and mimeType='application/vnd.google-apps.folder' and trashed=false"
+        )
+        if parent_folder_id:
+            query += f" and '{_escape_query_value(parent_folder_id)}' in parents"
+        return query
+
     def find_folder(self, folder_name: str, parent_folder_id: str = None) -> str:
         """
         Find a folder by name in Google Drive
@@ -101,21 +376,23 @@ class GoogleDriveClient:
         """
         parent_folder_id = parent_folder_id or config.GOOGLE_DRIVE_FOLDER_ID
 
-        query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
-        if parent_folder_id:
-            query += f" and '{parent_folder_id}' in parents"
+        folder_id = self._cached_folder_id(folder_name, parent_folder_id)
+        if folder_id:
+            return folder_id
 
         try:
             results = self.service.files().list(
-                q=query,
-                spaces='drive',
+                q=self._folder_query(folder_name, parent_folder_id),
+                pageSize=1,
                 fields='files(id, name)'
             ).execute()
 
             files = results.get('files', [])
-            return files[0]['id'] if files else None
+            folder_id = files[0]['id'] if files else None
+            self._cache_folder_id(folder_name, parent_folder_id, folder_id)
+            return folder_id
         except HttpError as error:
-            print(f"An error occurred while searching for folder: {error}")
+            LOGGER.warning("find_folder failed name=%s parent=%s: %s", folder_name, parent_folder_id, error)
             return None
 
     def get_or_create_folder(self, folder_name: str, parent_folder_id: str = None) -> str:
@@ -134,7 +411,148 @@ class GoogleDriveClient:
             return folder_id
         return self.create_folder(folder_name, parent_folder_id)
 
-    def upload_file(self, file_path: str, folder_id: str = None, file_name: str = None) -> str:
+    @staticmethod
+    def _file_md5(file_path: str) -> str:
+        """Compute a file's MD5 hex digest, reading it in chunks"""
+        digest = hashlib.md5()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def find_unchanged_file(self, file_path: str, file_name: str, folder_id: str = None) -> str:
+        """
+        Find a file in Drive with the same name and content as a local file
+
+        Args:
+            file_path: Path to the local file
+            file_name: Name of the file in Drive
+            folder_id: Optional folder ID to search in
+
+        Returns:
+            File ID of the matching Drive file, None if there is no identical copy
+        """
+        query = f"name='{_escape_query_value(file_name)}' and trashed=false"
+        if folder_id:
+            query += f" and '{_escape_query_value(folder_id)}' in parents"
+
+        try:
+            results = self.service.files().list(
+                q=query,
+                fields='files(id, md5Checksum)'
+            ).execute()
+        except HttpError as error:
+            LOGGER.warning("Existing-file check failed name=%s folder=%s: %s", file_name, folder_id, error)
+            return None
+
+        files = results.get('files', [])
+        if not files:
+            return None
+
+        local_md5 = self._file_md5(file_path)
+        for drive_file in files:
+            if drive_file.get('md5Checksum') == local_md5:
+                return drive_file['id']
+        return None
+
+    def batch_get_or_create_folders(
+        self, folder_names: List[str], parent_folder_id: str = None
+    ) -> Dict[str, str]:
+        """
+        Get or create several folders using batched API requests
+
+        All lookups go out in one batch request, then all missing folders are
+        created in a second one, instead of a list + create round-trip per folder.
+
+        Args:
+            folder_names: Names of the folders to find or create
+            parent_folder_id: Optional parent folder ID (uses config default if not provided)
+
+        Returns:
+            Dict mapping folder name to folder ID (folders that failed are omitted)
+        """
+        parent_folder_id = parent_folder_id or config.GOOGLE_DRIVE_FOLDER_ID
+        folder_ids = {}
+        unique_names = []
+        for name in dict.fromkeys(folder_names):
+            cached_id = self._cached_folder_id(name, parent_folder_id)
+            if cached_id:
+                folder_ids[name] = cached_id
+            else:
+                unique_names.append(name)
+
+        def execute_batch(requests_by_name, callback, writes=False):
+            # Drive accepts at most 100 calls per batch request
+            names = list(requests_by_name)
+            for start in range(0, len(names), 100):
+                batch = self.service.new_batch_http_request(callback=callback)
+                for index in range(start, min(start + 100, len(names))):
+                    # Each call in a batch counts against the write quota separately
+                    if writes:
+                        _WRITE_BUCKET.acquire()
+                    # Request IDs go into MIME headers, so use indexes rather than names
+                    batch.add(requests_by_name[names[index]], request_id=str(index))
+                try:
+                    batch.execute()
+                except HttpError as error:
+                    LOGGER.error("Folder batch request failed parent=%s: %s", parent_folder_id, error)
+
+        def on_found(request_id, response, exception):
+            if exception is not None:
+                LOGGER.warning(
+                    "Batched folder lookup failed name=%s parent=%s: %s",
+                    unique_names[int(request_id)], parent_folder_id, exception
+                )
+                return
+            files = response.get('files', [])
+            if files:
+                name = unique_names[int(request_id)]
+                folder_ids[name] = files[0]['id']
+                self._cache_folder_id(name, parent_folder_id, files[0]['id'])
+
+        execute_batch({
+            name: self.service.files().list(
+                q=self._folder_query(name, parent_folder_id),
+                pageSize=1,
+                fields='files(id, name)'
+            )
+            for name in unique_names
+        }, on_found)
+
+        missing_names = [name for name in unique_names if name not in folder_ids]
+        if not missing_names:
+            return folder_ids
+
+        def on_created(request_id, response, exception):
+            name = missing_names[int(request_id)]
+            if exception is not None:
+                if isinstance(exception, HttpError) and self._is_rate_limited(exception):
+                    _WRITE_BUCKET.penalize()
+                LOGGER.error("Batched folder create failed name=%s parent=%s: %s", name, parent_folder_id, exception)
+                return
+            folder_ids[name] = response.get('id')
+            self._cache_folder_id(name, parent_folder_id, response.get('id'))
+
+        create_requests = {}
+        for name in missing_names:
+            file_metadata = {
+                'name': name,
+                'mimeType': 'application/vnd.google-apps.folder'
+            }
+            if parent_folder_id:
+                file_metadata['parents'] = [parent_folder_id]
+            create_requests[name] = self.service.files().create(body=file_metadata, fields='id')
+        execute_batch(create_requests, on_created, writes=True)
+
+        return folder_ids
+
+    def upload_file(
+        self,
+        file_path: str,
+        folder_id: str = None,
+        file_name: str = None,
+        skip_if_unchanged: bool = False
+    ) -> str:
         """
         Upload a file to Google Drive
 
@@ -142,9 +560,11 @@ class GoogleDriveClient:
             file_path: Path to the file to upload
             folder_id: Optional folder ID to upload to (uses config default if not provided)
             file_name: Optional custom filename
+            skip_if_unchanged: Return the existing file's ID instead of uploading when
+                the folder already has a file with the same name and MD5 checksum
 
         Returns:
-            File ID of the uploaded file
+            File ID of the uploaded (or already present) file
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
@@ -159,17 +579,119 @@ class GoogleDriveClient:
         if folder_id:
             file_metadata['parents'] = [folder_id]
 
-        media = MediaFileUpload(file_path, resumable=True)
+        if skip_if_unchanged:
+            existing_id = self.find_unchanged_file(file_path, file_name, folder_id)
+            if existing_id:
+                return existing_id
 
-        try:
-            file = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id'
-            ).execute()
+        # Small reports go up in one multipart request; resumable sessions cost an
+        # extra round-trip to open and only pay off for large files
+        file_size = os.path.getsize(file_path)
+        chunked = file_size >= CHUNKED_UPLOAD_THRESHOLD
+        if chunked:
+            chunksize, resumable = UPLOAD_CHUNK_SIZE, True
+        elif file_size >= RESUMABLE_UPLOAD_THRESHOLD:
+            chunksize, resumable = -1, True
+        else:
+            chunksize, resumable = -1, False
+        mimetype = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
 
-            return file.get('id')
-        except HttpError as error:
-            print(f"An error occurred: {error}")
-            raise
+        # One handle for every attempt (MediaFileUpload would reopen the file and
+        # re-guess the mimetype per retry, and only close it when garbage-collected)
+        with open(file_path, 'rb') as fh:
+            for attempt in range(MAX_UPLOAD_RETRIES + 1):
+                fh.seek(0)
+                media = MediaIoBaseUpload(fh, mimetype, chunksize=chunksize, resumable=resumable)
+
+                _WRITE_BUCKET.acquire()
+                try:
+                    request = self.service.files().create(
+                        body=file_metadata,
+                        media_body=media,
+                        fields='id'
+                    )
+                    if chunked:
+                        file = self._upload_in_chunks(request)
+                    else:
+                        file = request.execute()
+
+                    return file.get('id')
+                except HttpError as error:
+                    if self._is_rate_limited(error):
+                        _WRITE_BUCKET.penalize()
+                    if attempt < MAX_UPLOAD_RETRIES and self._is_rate_limited(error):
+                        # Exponential backoff with jitter so parallel uploads don't retry in lockstep
+                        time.sleep(2 ** attempt + random.random())
+                        continue
+                    LOGGER.error("upload_file failed name=%s folder=%s: %s", file_name, folder_id, error)
+                    raise
+
+    @staticmethod
+    def _upload_in_chunks(request) -> Dict:
+        """
+        Drive a resumable upload one chunk at a time
+
+        Drive requires resumable chunks to arrive in order, so they are sent
+        sequentially; next_chunk() retries transient failures (5xx/429) per chunk
+        and resumes from the last byte the server acknowledged.
+
+        Args:
+            request: files().create request with a chunked resumable media body
+
+        Returns:
+            The created file resource
+        """
+        response = None
+        while response is None:
+            _, response = request.next_chunk(num_retries=MAX_UPLOAD_RETRIES)
+        return response
+
+    def upload_files(
+        self,
+        file_paths: List[str],
+        folder_id: str = None,
+        max_workers: int = 8,
+        skip_if_unchanged: bool = False
+    ) -> Dict[str, str]:
+        """
+        Upload several files to Google Drive concurrently
+
+        Uploads run on a thread pool (each thread uses its own Drive service) and
+        share the client-wide write rate limit.
+
+        Args:
+            file_paths: Paths of the files to upload
+            folder_id: Optional folder ID to upload to (uses config default if not provided)
+            max_workers: Maximum number of concurrent uploads
+            skip_if_unchanged: Passed through to upload_file()
+
+        Returns:
+            Dict mapping file path to Drive file ID, in input order (failed uploads are omitted)
+        """
+        uploaded = {}
+        if not file_paths:
+            return uploaded
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+            futures = [
+                (file_path, executor.submit(
+                    self.upload_file, file_path, folder_id, skip_if_unchanged=skip_if_unchanged
+                ))
+                for file_path in file_paths
+            ]
+            for file_path, future in futures:
+                try:
+                    uploaded[file_path] = future.result()
+                except Exception as e:
+                    LOGGER.error("Upload failed path=%s: %s", file_path, e)
+
+        return uploaded
+
+    @staticmethod
+    def _is_rate_limited(error: HttpError) -> bool:
+        """Whether an HttpError is a Drive rate-limit rejection worth retrying"""
+        status = error.resp.status
+        if status == 429:
+            return True
+        return status == 403 and b'ratelimitexceeded' in (error.content or b'').lower()
 
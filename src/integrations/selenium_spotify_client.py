@@ -10,7 +10,9 @@ import time
 import logging
 import base64
 import os
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Sequence, Tuple
 
 try:
@@ -29,6 +31,62 @@ from src.utils.browser import ChromeDriverManager
 
 LOGGER = logging.getLogger(__name__)
 
+# Track count in the playlist header, e.g. "50 songs, about 2 hr"
+_STATS_RE = re.compile(r"(\d+)\s+(?:songs|tracks|items)")
+
+# Entity type and ID in a Spotify URL (also matches localized /intl-xx/ paths)
+_URL_RE = re.compile(r"/(track|album|artist)/([A-Za-z0-9]+)")
+
+
+@lru_cache(maxsize=4096)
+def _spotify_id(url: str, kind: str) -> Optional[str]:
+    """Return the ID from a Spotify track/album/artist URL if it is of that kind"""
+    match = _URL_RE.search(url)
+    if match and match.group(1) == kind:
+        return match.group(2)
+    return None
+
+
+@dataclass(slots=True)
+class TrackRecord:
+    """
+    One scraped track row
+
+    Used while scrolling, where every harvest creates records that are mostly
+    duplicates; converted with to_dict() once collection is done, since the
+    rest of the pipeline works with track dicts.
+    """
+
+    position: int
+    track_id: str
+    track_name: str
+    artist: str  # Comma-separated names, for backwards compatibility
+    artists: List[Dict]  # Names with URLs for hyperlinking
+    album: Optional[str]
+    album_url: Optional[str]
+    duration: Optional[str]  # Displayed m:ss text, if rendered
+    spotify_url: Optional[str]
+    explicit: bool
+    duration_ms: Optional[int] = None  # Filled in by API enrichment
+    popularity: Optional[int] = None  # Not available via scraping
+
+    def to_dict(self) -> Dict:
+        """Return the track dict shape expected by enrichment and the reports"""
+        return {
+            "position": self.position,
+            "track_id": self.track_id,
+            "track_name": self.track_name,
+            "artist": self.artist,
+            "artists": self.artists,
+            "album": self.album,
+            "album_url": self.album_url,
+            "duration_ms": self.duration_ms,
+            "duration": self.duration,
+            "popularity": self.popularity,
+            "spotify_url": self.spotify_url,
+            "explicit": self.explicit,
+        }
+
 
 class SeleniumSpotifyClient:
     """
@@ -44,6 +102,85 @@ class SeleniumSpotifyClient:
     """
 
     TRACK_ROW_SELECTOR = '[data-testid="tracklist-row"]'
+    MIN_INITIAL_ROWS = 10  # Rows to wait for before metadata/scrolling start
+    COVER_IMAGE_SIZE = 300  # Pixels (square) for the embedded playlist cover
+
+    # Reads every rendered track row in one WebDriver call instead of walking
+    # each row and field with find_element/get_attribute round-trips. Rows are
+    # stamped with data-harvested so later scrolls skip them; the stamp holds the
+    # row index and track link because the virtualized list recycles row elements.
+    # The query is scoped to the scroll container when it holds the rows, so
+    # the browser does not match the selector against the whole page
+    HARVEST_ROWS_SCRIPT = """
+        const text = (el) => (el && el.innerText ? el.innerText.trim() : '');
+        const digits = (value) => (/^\\d+$/.test(value || '') ? parseInt(value, 10) : null);
+        const e = arguments[1];
+        const root = e && e.querySelector(arguments[0]) ? e : document;
+        const harvested = [];
+        for (const row of root.querySelectorAll(arguments[0])) {
+            const link = row.querySelector('a[href*="/track/"]');
+            const stamp = (row.getAttribute('aria-rowindex') || '') + '|' + (link ? link.href : '');
+            if (row.dataset.harvested === stamp) { continue; }
+            row.dataset.harvested = stamp;
+            let position = digits(row.getAttribute('aria-rowindex'));
+            // Fallback to the visible index cell. This runs in the same call and
+            // needs no extra round-trips; the aria-rowindex on the wrapping
+            // role="row" element is not used because it counts the header row
+            if (position === null) {
+                const selectors = ['[data-testid="tracklist-row-index"]', 'span[data-testid="index"]', 'span'];
+                outer: for (const selector of selectors) {
+                    for (const el of row.querySelectorAll(selector)) {
+                        position = digits(text(el));
+                        if (position !== null) break outer;
+                    }
+                }
+            }
+            const trackLink = row.querySelector('a[href*="/track/"]');
+            const album = row.querySelector('a[href*="/album/"]')
+                || row.querySelector('[data-testid="tracklist-row-album-name"]');
+            harvested.push({
+                position: position,
+                track_href: trackLink ? trackLink.href : null,
+                track_name: text(trackLink),
+                aria_label: row.getAttribute('aria-label') || '',
+                artists: Array.from(row.querySelectorAll('a[href*="/artist/"]'))
+                    .map((a) => ({name: text(a), href: a.href || ''})),
+                album_name: album ? text(album) : null,
+                album_href: album && album.href ? album.href : null,
+                duration: text(row.querySelector('[data-testid="tracklist-duration"]')) || null,
+                explicit: !!row.querySelector('span[aria-label="Explicit"]'),
+            });
+        }
+        return {rows: harvested, metrics: e ? [e.scrollHeight, e.clientHeight, e.scrollTop] : null};
+    """
+
+    # [scrollHeight, clientHeight, scrollTop] of arguments[0] in one round-trip
+    SCROLL_METRICS_SCRIPT = (
+        "var e = arguments[0]; return [e.scrollHeight, e.clientHeight, e.scrollTop];"
+    )
+
+    # Scroll on the next animation frame and measure on the one after, so the
+    # result reflects the new layout without a fixed sleep in between. Also
+    # returns the ROW_STATE_SCRIPT snapshot so the next wait needs no extra call
+    SCROLL_AND_MEASURE_SCRIPT = """
+        const e = arguments[0], amount = arguments[1], done = arguments[arguments.length - 1];
+        requestAnimationFrame(() => {
+            e.scrollTop += amount;
+            requestAnimationFrame(() => {
+                const rows = document.querySelectorAll(arguments[2]);
+                const last = rows.length ? rows[rows.length - 1].getAttribute('aria-rowindex') : null;
+                done([e.scrollHeight, e.clientHeight, e.scrollTop, [rows.length, e.scrollHeight, last]]);
+            });
+        });
+    """
+
+    # [row count, scrollHeight, last row's aria-rowindex]; changes whenever the
+    # virtualized list renders new rows, even if it recycles the row elements
+    ROW_STATE_SCRIPT = """
+        const rows = document.querySelectorAll(arguments[1]);
+        const last = rows.length ? rows[rows.length - 1].getAttribute('aria-rowindex') : null;
+        return [rows.length, arguments[0].scrollHeight, last];
+    """
 
     def __init__(
         self,
@@ -67,6 +204,9 @@ class SeleniumSpotifyClient:
             logger=self.logger,
         )
         self._driver = None
+        self._wheel_target = None  # (container, x, y) for CDP wheel scrolling
+        self._long_wait = None  # Page-load wait, built once per driver
+        self._short_wait = None  # Quick element probes, built once per driver
 
     def get_playlist_tracks(
         self, playlist_id: str, playlist_name: Optional[str] = None
@@ -86,6 +226,11 @@ class SeleniumSpotifyClient:
         url_with_bust = f"{playlist_url}?_={int(time.time())}"
 
         driver = self._manager.get_driver()
+        if driver is not self._driver:
+            # The manager reuses one driver across playlists, so build the waits once
+            # Spotify usually renders the first row within a few hundred ms, so poll finely
+            self._long_wait = WebDriverWait(driver, self.wait_timeout, poll_frequency=0.1)
+            self._short_wait = WebDriverWait(driver, 3, poll_frequency=0.1)
         self._driver = driver
 
         self.logger.info(f"Navigating to playlist: {playlist_url}")
@@ -103,10 +248,9 @@ class SeleniumSpotifyClient:
         except Exception as e:
             self.logger.warning(f"Could not focus window after page load: {e}")
 
-        wait = WebDriverWait(driver, self.wait_timeout)
         try:
             self.logger.info(f"Waiting for track list to load (timeout: {self.wait_timeout}s)...")
-            wait.until(
+            self._long_wait.until(
                 EC.presence_of_element_located(
                     (By.CSS_SELECTOR, self.TRACK_ROW_SELECTOR)
                 )
@@ -126,22 +270,20 @@ class SeleniumSpotifyClient:
                 f"URL: {playlist_url}"
             ) from exc
 
-        # Wait for page to render
-        self.logger.info("Waiting for page to fully render...")
-        time.sleep(3)
+        # Give the first screen of rows a moment to render (short playlists just time out)
+        try:
+            self._short_wait.until(
+                lambda d: d.execute_script(
+                    "return document.querySelectorAll(arguments[0]).length;", self.TRACK_ROW_SELECTOR
+                ) >= self.MIN_INITIAL_ROWS
+            )
+        except TimeoutException:
+            self.logger.debug(f"Fewer than {self.MIN_INITIAL_ROWS} rows rendered, continuing")
         self.logger.info("Page loaded, extracting tracks...")
 
         # DEBUG: Save screenshot and page info for CI debugging
         self._save_debug_info(driver, playlist_id, "after_load")
 
-        # Focus window
-        try:
-            driver.execute_script("window.focus();")
-            driver.switch_to.window(driver.current_window_handle)
-            time.sleep(0.5)
-        except Exception as e:
-            self.logger.warning(f"Could not focus window: {e}")
-
         # Get playlist metadata
         self.logger.info("Extracting playlist metadata...")
         metadata = self._extract_playlist_metadata(driver, playlist_id, playlist_url)
@@ -193,17 +335,25 @@ class SeleniumSpotifyClient:
             self.logger.info(f"DEBUG: Page source saved to {source_path}")
 
             # Log first few visible track names for quick debugging
+            # (row count and names come back from one script call)
             try:
-                track_rows = driver.find_elements(By.CSS_SELECTOR, self.TRACK_ROW_SELECTOR)[:5]
-                self.logger.info(f"DEBUG: Found {len(driver.find_elements(By.CSS_SELECTOR, self.TRACK_ROW_SELECTOR))} total track rows")
-                for i, row in enumerate(track_rows):
-                    try:
-                        # Try to get track name
-                        track_name_el = row.find_element(By.CSS_SELECTOR, 'a[data-testid="internal-track-link"] div')
-                        track_name = track_name_el.text if track_name_el else "Unknown"
+                row_count, track_names = driver.execute_script(
+                    """
+                    const rows = document.querySelectorAll(arguments[0]);
+                    const names = Array.from(rows).slice(0, 5).map((row) => {
+                        const el = row.querySelector('a[data-testid="internal-track-link"] div');
+                        return el ? el.innerText : null;
+                    });
+                    return [rows.length, names];
+                    """,
+                    self.TRACK_ROW_SELECTOR,
+                )
+                self.logger.info(f"DEBUG: Found {row_count} total track rows")
+                for i, track_name in enumerate(track_names):
+                    if track_name is None:
+                        self.logger.debug(f"DEBUG: Could not get track {i+1} name")
+                    else:
                         self.logger.info(f"DEBUG: Track {i+1}: {track_name}")
-                    except Exception as e:
-                        self.logger.debug(f"DEBUG: Could not get track {i+1} name: {e}")
             except Exception as e:
                 self.logger.warning(f"DEBUG: Could not enumerate tracks: {e}")
 
@@ -222,77 +372,79 @@ class SeleniumSpotifyClient:
         return f"https://open.spotify.com/playlist/{reference}"
 
     def _dismiss_cookie_banner(self, driver):
-        """Click cookie banner if present"""
+        """Click cookie banner if present (single probe, no wait when absent)"""
         selectors = [
             'button[id="onetrust-accept-btn-handler"]',
             'button[data-testid="cookie-banner-accept-button"]',
             'button[data-testid="consent-accept-button"]',
         ]
-        for selector in selectors:
-            try:
-                element = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+        try:
+            element = driver.execute_script(
+                "var el = document.querySelector(arguments[0]); if (el) { el.click(); } return el;",
+                ", ".join(selectors),
+            )
+            if element:
+                self._short_wait.until(
+                    EC.invisibility_of_element(element)
                 )
-                element.click()
-                time.sleep(0.5)
-                return
-            except Exception:
-                continue
+        except Exception:
+            pass
 
     def _extract_playlist_metadata(
         self, driver, playlist_id: str, playlist_url: str
     ) -> Dict:
         """Extract playlist name, description, and other metadata"""
-        name = self._first_text(
-            driver,
-            [
-                '[data-testid="entityTitle"]',
-                'h1[class*="Title"]',
-                'h1[data-encore-id="type"]',
-            ],
-        )
-
-        description = self._first_text(
-            driver,
-            [
-                '[data-testid="entityDescription"]',
-                '[data-testid="entityDescription"] span',
-                'div[data-testid="description"]',
-            ],
-        )
-
-        stats_text = self._first_text(
+        fields = self._extract_text_fields_js(
             driver,
-            [
-                '[data-testid="followers-count"]',
-                '[data-testid="entityStats"]',
-                'span[class*="Stat"]',
-            ],
+            {
+                "name": [
+                    '[data-testid="entityTitle"]',
+                    'h1[class*="Title"]',
+                    'h1[data-encore-id="type"]',
+                ],
+                "description": [
+                    '[data-testid="entityDescription"]',
+                    '[data-testid="entityDescription"] span',
+                    'div[data-testid="description"]',
+                ],
+                "stats": [
+                    '[data-testid="followers-count"]',
+                    '[data-testid="entityStats"]',
+                    'span[class*="Stat"]',
+                ],
+            },
         )
+        name = fields.get("name")
+        description = fields.get("description")
+        stats_text = fields.get("stats")
 
         expected_track_count = None
         if stats_text:
-            patterns = [r"(\d+)\s+songs", r"(\d+)\s+tracks", r"(\d+)\s+items"]
-            for pattern in patterns:
-                match = re.search(pattern, stats_text.lower())
-                if match:
-                    expected_track_count = int(match.group(1))
-                    break
+            match = _STATS_RE.search(stats_text.lower())
+            if match:
+                expected_track_count = int(match.group(1))
 
         # Extract playlist cover image via screenshot (more reliable than URL extraction)
         playlist_image_base64 = None
         try:
-            # Wait a moment for page to fully render
-            time.sleep(1)
-            
-            # Find the playlist cover photo container
+            # Find the playlist cover photo container (the wait below covers late rendering)
             try:
                 # Try primary selector for cover photo container
-                cover_container = WebDriverWait(driver, 5).until(
+                cover_container = self._short_wait.until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, 'div[data-testid="entityCoverPhoto"]'))
                 )
-                # Take screenshot of the cover container
-                screenshot_bytes = cover_container.screenshot_as_png
+                # ChromeDriverManager blocks image downloads, so the cover <img> is
+                # usually unloaded; its src is the same CDN URL the API returns
+                playlist_image_base64 = self._cover_image_url(driver, cover_container)
+                if not playlist_image_base64:
+                    # Downscaled JPEG drawn in the browser (already a data URI); far
+                    # smaller than a full-size PNG screenshot
+                    playlist_image_base64 = self._cover_image_jpeg(driver, cover_container)
+                if not playlist_image_base64:
+                    # Canvas was tainted: let the browser encode a clipped JPEG screenshot
+                    playlist_image_base64 = self._cover_screenshot_jpeg(driver, cover_container)
+                # PNG element screenshot as the last resort
+                screenshot_bytes = None if playlist_image_base64 else cover_container.screenshot_as_png
                 if screenshot_bytes:
                     # Convert to base64 data URI for embedding in HTML
                     playlist_image_base64 = f"data:image/png;base64,{base64.b64encode(screenshot_bytes).decode('utf-8')}"
@@ -330,6 +482,108 @@ class SeleniumSpotifyClient:
             "playlist_image": playlist_image_base64,  # Base64 data URI from screenshot
         }
 
+    def _cover_image_url(self, driver, cover_element) -> Optional[str]:
+        """Return the cover image URL from the page without downloading the image"""
+        try:
+            url = driver.execute_script(
+                """
+                const img = arguments[0].tagName === 'IMG' ? arguments[0] : arguments[0].querySelector('img');
+                return img ? (img.currentSrc || img.src || img.getAttribute('src')) : null;
+                """,
+                cover_element,
+            )
+        except Exception as e:
+            self.logger.debug(f"Could not read cover image URL: {e}")
+            return None
+        if url and url.startswith("http"):
+            self.logger.debug(f"Cover image URL read from page: {url}")
+            return url
+        return None
+
+    def _cover_image_jpeg(self, driver, cover_element) -> Optional[str]:
+        """
+        Resize the playlist cover on a canvas and return it as a JPEG data URI
+
+        Returns None when the canvas cannot be exported (e.g. a cross-origin
+        image taints it), so callers fall back to an element screenshot.
+        """
+        try:
+            data_url = driver.execute_script(
+                """
+                const img = arguments[0].tagName === 'IMG' ? arguments[0] : arguments[0].querySelector('img');
+                if (!img || !img.complete || !img.naturalWidth) { return null; }
+                const canvas = document.createElement('canvas');
+                canvas.width = canvas.height = arguments[1];
+                canvas.getContext('2d').drawImage(img, 0, 0, arguments[1], arguments[1]);
+                return canvas.toDataURL('image/jpeg', 0.85);
+                """,
+                cover_element,
+                self.COVER_IMAGE_SIZE,
+            )
+        except Exception as e:
+            self.logger.debug(f"Canvas cover export failed, using screenshot: {e}")
+            return None
+        if data_url and data_url.startswith("data:image/jpeg"):
+            self.logger.debug(f"Cover image exported via canvas ({len(data_url)} chars)")
+            return data_url
+        return None
+
+    def _cover_screenshot_jpeg(self, driver, cover_element) -> Optional[str]:
+        """
+        Capture the cover element as a JPEG data URI via CDP Page.captureScreenshot
+
+        The browser encodes the JPEG and returns base64 directly. Returns None on
+        non-Chromium drivers or if the capture fails.
+        """
+        try:
+            x, y, width, height = driver.execute_script(
+                "var r = arguments[0].getBoundingClientRect();"
+                "return [r.left + window.scrollX, r.top + window.scrollY, r.width, r.height];",
+                cover_element,
+            )
+            if not width or not height:
+                return None
+            result = driver.execute_cdp_cmd("Page.captureScreenshot", {
+                "format": "jpeg",
+                "quality": 85,
+                "clip": {"x": x, "y": y, "width": width, "height": height, "scale": 1},
+            })
+        except Exception as e:
+            self.logger.debug(f"CDP cover screenshot failed, using PNG screenshot: {e}")
+            return None
+        data = result.get("data") if result else None
+        if not data:
+            return None
+        self.logger.debug(f"Cover image captured via CDP ({len(data)} chars)")
+        return f"data:image/jpeg;base64,{data}"
+
+    def _extract_text_fields_js(self, driver, spec: Dict[str, Sequence[str]]) -> Dict[str, Optional[str]]:
+        """
+        Resolve several selector lists to text in one script call
+
+        Args:
+            driver: Selenium WebDriver instance
+            spec: Field name -> selectors in priority order
+
+        Returns:
+            Field name -> stripped text of the first matching element (None if no match)
+        """
+        try:
+            return driver.execute_script(
+                """
+                const out = {};
+                for (const [key, selectors] of Object.entries(arguments[0])) {
+                    const el = selectors.map((s) => document.querySelector(s)).find((e) => e);
+                    out[key] = el ? el.innerText.trim() : null;
+                }
+                return out;
+                """,
+                spec,
+            ) or {}
+        except Exception as e:
+            self.logger.debug(f"Metadata text harvest failed, falling back to per-selector lookups: {e}")
+            return {key: self._first_text(driver, selectors) for key, selectors in spec.items()}
+
     def _locate_scroll_container(self, driver):
         """Find the scrollable container for the track list"""
         selectors = [
@@ -338,25 +592,33 @@ class SeleniumSpotifyClient:
             'div[data-overlayscrollbars-viewport]',
         ]
 
-        # First, try to find a container that is actually scrollable
-        for selector in selectors:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            for elem in elements:
-                try:
-                    # Check if this element is actually scrollable
-                    scroll_height = driver.execute_script("return arguments[0].scrollHeight;", elem)
-                    client_height = driver.execute_script("return arguments[0].clientHeight;", elem)
-
-                    if scroll_height > client_height:
-                        # This element is scrollable!
-                        self.logger.debug(
-                            f"Found scrollable container: {selector} "
-                            f"(scrollHeight: {scroll_height}, clientHeight: {client_height})"
-                        )
-                        return elem
-                except Exception as e:
-                    # Element might be stale or not accessible, try next
-                    continue
+        # First, find a container that is actually scrollable (one script call
+        # checks every candidate instead of two round-trips per element)
+        try:
+            found = driver.execute_script(
+                """
+                const selectors = arguments[0];
+                for (let i = 0; i < selectors.length; i++) {
+                    for (const e of document.querySelectorAll(selectors[i])) {
+                        if (e.scrollHeight > e.clientHeight) {
+                            return [i, e, e.scrollHeight, e.clientHeight];
+                        }
+                    }
+                }
+                return null;
+                """,
+                selectors,
+            )
+        except Exception as e:
+            self.logger.debug(f"Scroll container probe failed: {e}")
+            found = None
+        if found:
+            index, elem, scroll_height, client_height = found
+            self.logger.debug(
+                f"Found scrollable container: {selectors[index]} "
+                f"(scrollHeight: {scroll_height}, clientHeight: {client_height})"
+            )
+            return elem
 
         # Fallback: use old behavior if no scrollable container found
         # This handles edge cases where the container becomes scrollable after initial load
@@ -369,10 +631,15 @@ class SeleniumSpotifyClient:
         raise RuntimeError("Could not locate playlist scroll container")
 
     def _ensure_window_focused(self, driver, container):
-        """Ensure browser window is focused for scrolling"""
+        """
+        Ensure browser window is focused for scrolling
+
+        Called once before the scroll loop; focus does not revert while the
+        loop drives the page through JavaScript.
+        """
         try:
-            driver.execute_script("window.focus();")
-            time.sleep(0.5)
+            if driver.execute_script("window.focus(); return document.hasFocus();"):
+                return
 
             try:
                 container.click()
@@ -383,13 +650,14 @@ class SeleniumSpotifyClient:
                 except Exception:
                     pass
 
+            if driver.execute_script("return document.hasFocus();"):
+                return
+
             try:
                 actions = ActionChains(driver)
                 actions.move_to_element(container).click().perform()
             except Exception:
                 pass
-
-            time.sleep(0.5)
         except Exception as e:
             self.logger.warning(f"Could not ensure window focus: {e}")
 
@@ -405,17 +673,35 @@ class SeleniumSpotifyClient:
         Returns:
             bool: True if scroll was successful, False otherwise
         """
+        # Strategy 0: Real wheel event over the container via CDP (Chromium only);
+        # one DevTools message, and the virtualized list reacts as it would to a user
+        try:
+            x, y = self._wheel_position(driver, container)
+            driver.execute_cdp_cmd("Input.dispatchMouseEvent", {
+                "type": "mouseWheel",
+                "x": x,
+                "y": y,
+                "deltaX": 0,
+                "deltaY": scroll_amount,
+            })
+            return True
+        except Exception as e:
+            self.logger.debug(f"CDP wheel scroll failed: {e}")
+
         # Strategy 1: Scroll the container directly
         try:
             driver.execute_script(
                 f"arguments[0].scrollTop += {scroll_amount};", container
             )
-            time.sleep(0.3)
 
             # Verify scroll actually happened
-            new_scroll = driver.execute_script("return arguments[0].scrollTop;", container)
-            if new_scroll > 0:
+            try:
+                WebDriverWait(driver, 0.3, poll_frequency=0.05).until(
+                    lambda d: d.execute_script("return arguments[0].scrollTop;", container) > 0
+                )
                 return True
+            except TimeoutException:
+                pass
         except Exception as e:
             self.logger.debug(f"Container scroll failed: {e}")
 
@@ -424,7 +710,6 @@ class SeleniumSpotifyClient:
             driver.execute_script(
                 f"arguments[0].scrollBy(0, {scroll_amount});", container
             )
-            time.sleep(0.3)
             return True
         except Exception as e:
             self.logger.debug(f"scrollBy on container failed: {e}")
@@ -433,17 +718,112 @@ class SeleniumSpotifyClient:
         try:
             self.logger.warning("Container scroll failed, trying window scroll as fallback")
             driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-            time.sleep(0.3)
             return True
         except Exception as e:
             self.logger.error(f"All scroll strategies failed: {e}")
             return False
 
+    def _wheel_position(self, driver, container) -> Tuple[float, float]:
+        """Viewport coordinates of the container centre (cached per container)"""
+        if self._wheel_target and self._wheel_target[0] is container:
+            return self._wheel_target[1], self._wheel_target[2]
+        x, y = driver.execute_script(
+            "var r = arguments[0].getBoundingClientRect();"
+            "return [r.left + r.width / 2, r.top + r.height / 2];",
+            container,
+        )
+        self._wheel_target = (container, x, y)
+        return x, y
+
+    def _scroll_and_measure(self, driver, container, scroll_amount) -> Optional[List[int]]:
+        """
+        Scroll the container and read its new metrics in a single async script
+
+        Returns:
+            [scrollHeight, clientHeight, scrollTop, row_state] after the scroll,
+            or None if the container did not move (caller falls back to
+            _scroll_container)
+        """
+        try:
+            metrics = driver.execute_async_script(
+                self.SCROLL_AND_MEASURE_SCRIPT, container, scroll_amount, self.TRACK_ROW_SELECTOR
+            )
+        except Exception as e:
+            self.logger.debug(f"Scroll-and-measure failed: {e}")
+            return None
+        if not metrics or metrics[2] <= 0:
+            return None
+        return metrics
+
+    def _row_state(self, driver, container) -> Optional[List]:
+        """Snapshot of the rendered rows used to detect lazy-loaded content"""
+        try:
+            return driver.execute_script(
+                self.ROW_STATE_SCRIPT, container, self.TRACK_ROW_SELECTOR
+            )
+        except Exception:
+            return None
+
+    def _wait_for_new_rows(self, driver, container, prev_state, timeout: float) -> bool:
+        """
+        Poll until the track list changes after a scroll, instead of a fixed sleep
+
+        Args:
+            driver: Selenium WebDriver instance
+            container: The scroll container element
+            prev_state: Row state captured right after the previous scroll
+            timeout: Upper bound in seconds (the old fixed scroll pause)
+
+        Returns:
+            bool: True if new rows appeared, False if the timeout was reached
+        """
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                lambda d: self._row_state(d, container) != prev_state
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def _wait_for_top_rows(self, driver, container, timeout: float = 2.0) -> bool:
+        """
+        Wait until the container is at the top and its first rows have settled
+
+        Replaces a fixed 2s sleep after resetting the scroll position: returns
+        once scrollTop is 0 and the first row's index and track link read the
+        same on two consecutive polls.
+
+        Returns:
+            bool: True if the rows settled, False if the timeout was reached
+        """
+        last = [None]
+
+        def settled(d):
+            state = d.execute_script(
+                """
+                const row = document.querySelector(arguments[1]);
+                if (arguments[0].scrollTop !== 0 || !row) { return null; }
+                const link = row.querySelector('a[href*="/track/"]');
+                return (row.getAttribute('aria-rowindex') || '') + '|' + (link ? link.href : '');
+                """,
+                container,
+                self.TRACK_ROW_SELECTOR,
+            )
+            stable = state is not None and state == last[0]
+            last[0] = state
+            return stable
+
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(settled)
+            return True
+        except TimeoutException:
+            return False
+
     def _collect_tracks(
         self, driver, container, expected_count: Optional[int]
     ) -> List[Dict]:
         """Extract all tracks using progressive scroll strategy"""
-        collected: List[Tuple[str, Dict]] = []
+        collected: List[Tuple[str, TrackRecord]] = []
         seen_keys: set[str] = set()
 
         # Optimized scroll parameters for speed
@@ -452,16 +832,38 @@ class SeleniumSpotifyClient:
         scroll_wait = self.scroll_pause  # Reduced wait time
         max_scroll_attempts = self.max_scroll_attempts
 
-        # Ensure window focused
+        # Focus once up front; the loop below never needs to re-focus
         self._ensure_window_focused(driver, container)
 
-        # Reset to top
+        # Reset to top and wait for the virtualized list to re-render its first rows
         driver.execute_script("arguments[0].scrollTop = 0;", container)
-        time.sleep(2)
+        self._wait_for_top_rows(driver, container)
 
         highest_position = [0]
+        distinct_positions: set[int] = set()
+        target_position = expected_count if expected_count else 50  # Target position to reach
+
+        # Deduplicate by position as rows arrive: one slot per chart position up to
+        # the target (index 0 unused), a dict for any beyond it, and a list for
+        # rows without a position
+        slots: List[Optional[TrackRecord]] = [None] * (target_position + 1)
+        extra_positions: Dict[int, TrackRecord] = {}
+        unpositioned: List[TrackRecord] = []
+
+        def place_track(track: TrackRecord, position: Optional[int]):
+            if not position or position <= 0:
+                unpositioned.append(track)
+                return
+            in_slots = position <= target_position
+            existing = slots[position] if in_slots else extra_positions.get(position)
+            # If duplicate position, keep the one with more data (track_id, etc.)
+            if existing is None or (track.track_id and not existing.track_id):
+                if in_slots:
+                    slots[position] = track
+                else:
+                    extra_positions[position] = track
 
-        def add_tracks_from_rows(rows: Sequence) -> int:
+        def add_tracks_from_rows(rows: Sequence[Dict]) -> int:
             new_count = 0
             for row in rows:
                 parsed = self._parse_track_row(row)
@@ -472,14 +874,18 @@ class SeleniumSpotifyClient:
                     continue
                 seen_keys.add(key)
                 collected.append((key, track))
+                place_track(track, position)
                 if position:
                     highest_position[0] = max(highest_position[0], position)
+                    distinct_positions.add(position)
                 new_count += 1
             return new_count
 
         consecutive_no_new_tracks = 0
-        max_consecutive_no_new = 8  # Increased to allow more scrolling for virtualized content
-        target_position = expected_count if expected_count else 50  # Target position to reach
+        max_consecutive_no_new = 4  # Safety net; the stable-height check below usually exits first
+        stable_scroll_height_iters = 0  # Iterations at the same scrollHeight with no new rows
+        prev_scroll_height = None
+        row_state = None  # Captured after each scroll; the reset above already waited
         
         # Track start time for overall timeout
         import time as time_module
@@ -505,22 +911,23 @@ class SeleniumSpotifyClient:
                 if scroll_attempt > 5:  # Only break if we've done some scrolling
                     break
             
-            time.sleep(scroll_wait)
+            if row_state is not None:
+                self._wait_for_new_rows(driver, container, row_state, scroll_wait)
 
-            rows = driver.find_elements(By.CSS_SELECTOR, self.TRACK_ROW_SELECTOR)
+            # New rows and the pre-scroll metrics come back from the same call
+            rows, pre_scroll_metrics = self._harvest_rows_js(driver, container)
             new_items = add_tracks_from_rows(rows)
 
             elapsed = time_module.time() - scroll_start_time
             self.logger.info(
                 f"Scroll {scroll_attempt + 1}/{max_scroll_attempts} ({elapsed:.1f}s): "
-                f"Visible: {len(rows)}, New: {new_items}, Total: {len(collected)}, "
+                f"Harvested: {len(rows)}, New: {new_items}, Total: {len(collected)}, "
                 f"Highest position: {highest_position[0]}"
             )
 
             # Check if we have collected all target positions (for top 50 playlists)
             if target_position == 50:
-                collected_positions = set([t[1].get('position') for t in collected if t[1].get('position')])
-                if len(collected_positions) >= 50 and max(collected_positions) >= 50:
+                if len(distinct_positions) >= 50 and highest_position[0] >= 50:
                     self.logger.info(
                         f"SUCCESS: Collected all 50 positions! Total tracks: {len(collected)}. "
                         f"Stopping early at {elapsed:.1f}s"
@@ -536,15 +943,9 @@ class SeleniumSpotifyClient:
             # Check if at bottom (improved detection for virtualized scrolling)
             # Wrap in try-except to handle stale container element
             try:
-                scroll_height = driver.execute_script(
-                    "return arguments[0].scrollHeight;", container
-                )
-                client_height = driver.execute_script(
-                    "return arguments[0].clientHeight;", container
-                )
-                current_scroll = driver.execute_script(
-                    "return arguments[0].scrollTop;", container
-                )
+                if pre_scroll_metrics is None:
+                    pre_scroll_metrics = driver.execute_script(self.SCROLL_METRICS_SCRIPT, container)
+                scroll_height, client_height, current_scroll = pre_scroll_metrics
                 max_scroll = scroll_height - client_height
             except Exception as e:
                 self.logger.warning(f"Container became stale, re-locating: {e}")
@@ -569,6 +970,23 @@ class SeleniumSpotifyClient:
 
             at_bottom = max_scroll > 0 and current_scroll >= max_scroll - 100
 
+            if new_items == 0 and scroll_height == prev_scroll_height:
+                stable_scroll_height_iters += 1
+            else:
+                stable_scroll_height_iters = 0
+            prev_scroll_height = scroll_height
+
+            # The list has stopped growing: at the bottom, same height and no new
+            # rows for two polled iterations, so further scrolling cannot add tracks
+            if stable_scroll_height_iters >= 2 and at_bottom:
+                log = self.logger.info if highest_position[0] >= target_position else self.logger.warning
+                log(
+                    f"Stopped scrolling: scrollHeight stable at {scroll_height} for "
+                    f"{stable_scroll_height_iters} scrolls at bottom with no new tracks. "
+                    f"Highest position: {highest_position[0]}/{target_position}, Total: {len(collected)}"
+                )
+                break
+
             # Stop if we've scrolled multiple times without finding new tracks AND we're at the bottom
             # AND we've reached the target position
             # This handles virtualized lists where scrollHeight keeps growing
@@ -596,12 +1014,12 @@ class SeleniumSpotifyClient:
                 # Reset to base increment when not at bottom
                 scroll_increment[0] = base_scroll_increment
 
-            # Ensure focused before scroll
-            self._ensure_window_focused(driver, container)
-
             # Scroll down using robust scrolling method with fallback strategies
             try:
-                scroll_success = self._scroll_container(driver, container, scroll_increment[0])
+                metrics = self._scroll_and_measure(driver, container, scroll_increment[0])
+                scroll_success = metrics is not None
+                if not scroll_success:
+                    scroll_success = self._scroll_container(driver, container, scroll_increment[0])
 
                 if not scroll_success:
                     self.logger.warning("Scroll failed using all strategies, attempting container re-location")
@@ -625,9 +1043,13 @@ class SeleniumSpotifyClient:
                     continue
 
                 # Check if we're at the actual bottom after scrolling (with tolerance for rounding)
-                time.sleep(0.2)  # Brief wait for scroll to register
-                new_scroll_height = driver.execute_script("return arguments[0].scrollHeight;", container)
-                new_current_scroll = driver.execute_script("return arguments[0].scrollTop;", container)
+                if metrics is None:
+                    time.sleep(0.2)  # Brief wait for the fallback scroll to register
+                    metrics = driver.execute_script(self.SCROLL_METRICS_SCRIPT, container)
+                    row_state = self._row_state(driver, container)
+                else:
+                    row_state = metrics[3]
+                new_scroll_height, _, new_current_scroll = metrics[:3]
                 new_max_scroll = new_scroll_height - client_height
             except Exception as e:
                 self.logger.warning(f"Container became stale during scroll, re-locating: {e}")
@@ -660,55 +1082,37 @@ class SeleniumSpotifyClient:
                     break
                 # If scrollHeight increased, continue scrolling (virtualized list still loading)
 
-        # Deduplicate by position, but also keep tracks without positions
-        deduplicated: Dict[int, Dict] = {}
-        tracks_without_position: List[Dict] = []
-        seen_track_ids: set = set()  # Track all seen track IDs globally
-
-        collected.sort(key=lambda item: (item[1].get("position", 9999), item[1].get("track_name", "")))
-
-        for _, track in collected:
-            track_id = track.get("track_id")
-            position = track.get("position")
+        # Positioned tracks are already deduplicated and ordered by their slots
+        # (records become plain dicts here, for the position fix-ups below and callers)
+        tracks = [track.to_dict() for track in slots[1:] if track]
+        tracks.extend(extra_positions[pos].to_dict() for pos in sorted(extra_positions))
+        positioned_count = len(tracks)
 
-            if position and position > 0:
-                if position not in deduplicated:
-                    deduplicated[position] = track
-                    if track_id:
-                        seen_track_ids.add(track_id)
-                else:
-                    # If duplicate position, keep the one with more data (track_id, etc.)
-                    existing = deduplicated[position]
-                    if track.get("track_id") and not existing.get("track_id"):
-                        deduplicated[position] = track
-                        if track_id:
-                            seen_track_ids.add(track_id)
-            else:
-                # Deduplicate tracks without positions by track_id
-                if track_id and track_id not in seen_track_ids:
-                    tracks_without_position.append(track)
-                    seen_track_ids.add(track_id)
-                elif not track_id:
-                    # Keep tracks without IDs (rare edge case)
-                    tracks_without_position.append(track)
-
-        # Combine tracks with positions and tracks without positions
-        tracks = [deduplicated[pos] for pos in sorted(deduplicated.keys())]
+        # Deduplicate tracks without positions by track_id
+        tracks_without_position: List[Dict] = []
+        seen_track_ids: set = set()
+        for track in sorted(unpositioned, key=lambda t: t.track_name):
+            track_id = track.track_id
+            if track_id and track_id not in seen_track_ids:
+                tracks_without_position.append(track.to_dict())
+                seen_track_ids.add(track_id)
+            elif not track_id:
+                # Keep tracks without IDs (rare edge case)
+                tracks_without_position.append(track.to_dict())
 
         # FIX (v1.2.0): Post-deduplication trimming for Top 50 playlists
         # Issue: Virtualized scrolling can load positions 50-67 simultaneously in single scroll,
         # causing over-collection before early exit check runs. This ensures exactly 50 tracks returned.
-        if target_position == 50 and len(deduplicated) >= 50:
+        if target_position == 50 and positioned_count >= 50:
             # Check if we have all positions 1-50
-            positions_collected = set(deduplicated.keys())
-            missing_positions = [pos for pos in range(1, 51) if pos not in positions_collected]
-            
-            if all(pos in positions_collected for pos in range(1, 51)):
+            missing_positions = [pos for pos in range(1, 51) if slots[pos] is None]
+
+            if not missing_positions:
                 # We have all 50 positions, trim to exactly 50 tracks
-                tracks = [deduplicated[pos] for pos in range(1, 51)]
+                tracks = tracks[:50]
                 self.logger.info(
                     f"SUCCESS: Collected all 50 target positions! "
-                    f"Trimmed from {len(deduplicated)} tracks with positions + {len(tracks_without_position)} without positions "
+                    f"Trimmed from {positioned_count} tracks with positions + {len(tracks_without_position)} without positions "
                     f"to exactly 50 tracks (positions 1-50)"
                 )
 
@@ -722,6 +1126,7 @@ class SeleniumSpotifyClient:
                 return tracks
             else:
                 # We don't have all positions 1-50 - log missing positions for debugging
+                positions_collected = [t["position"] for t in tracks[:positioned_count]]
                 self.logger.warning(
                     f"WARNING: Did not collect all 50 positions. Missing positions: {missing_positions}. "
                     f"Collected positions: {sorted(positions_collected)[:10]}... (showing first 10). "
@@ -752,50 +1157,60 @@ class SeleniumSpotifyClient:
 
         self.logger.info(
             f"Deduplication: {len(collected)} raw -> {len(tracks)} unique tracks "
-            f"({len(deduplicated)} with positions, {len(tracks_without_position)} without positions). "
+            f"({positioned_count} with positions, {len(tracks_without_position)} without positions). "
             f"Preserved original chart positions."
         )
 
         return tracks
 
-    def _parse_track_row(self, row) -> Optional[Tuple[str, Dict, Optional[int]]]:
-        """Parse a single track row into a track dictionary"""
+    def _harvest_rows_js(self, driver, container=None) -> Tuple[List[Dict], Optional[List[int]]]:
+        """
+        Read newly rendered track rows as plain dicts in a single script call
+
+        Args:
+            driver: Selenium WebDriver instance
+            container: Optional scroll container to measure in the same call
+
+        Returns:
+            (rows, [scrollHeight, clientHeight, scrollTop]); metrics are None
+            without a container or if the call failed (e.g. stale container)
+        """
+        try:
+            result = driver.execute_script(
+                self.HARVEST_ROWS_SCRIPT, self.TRACK_ROW_SELECTOR, container
+            ) or {}
+        except Exception as e:
+            self.logger.warning(f"Track row harvest failed: {e}")
+            return [], None
+        return result.get("rows") or [], result.get("metrics")
+
+    def _parse_track_row(self, row: Dict) -> Optional[Tuple[str, TrackRecord, Optional[int]]]:
+        """Turn a harvested row dict into a TrackRecord"""
         try:
-            position = self._extract_position(row)
+            position = row.get("position")
 
             # Track link and URL
-            track_link = None
-            for link in row.find_elements(By.CSS_SELECTOR, 'a[href*="/track/"]'):
-                href = link.get_attribute("href") or ""
-                if "/track/" in href:
-                    track_link = link
-                    break
-
-            track_url = (
-                track_link.get_attribute("href").split("?")[0] if track_link else None
-            )
+            track_href = row.get("track_href") or ""
+            track_url = track_href.partition("?")[0] if "/track/" in track_href else None
             track_id = self._extract_track_id(track_url) if track_url else None
 
             # Track name
-            track_name = None
-            if track_link:
-                track_name = track_link.text.strip()
+            track_name = row.get("track_name") if track_url else None
             if not track_name:
-                aria_label = row.get_attribute("aria-label") or ""
+                aria_label = row.get("aria_label") or ""
                 if aria_label.startswith("Play "):
-                    track_name = aria_label.replace("Play ", "").split(" by ")[0].strip()
+                    track_name = aria_label[5:].partition(" by ")[0].strip()
             if not track_name:
                 track_name = "Unknown Track"
 
             # Artist names with URLs for hyperlinking
-            artist_links = row.find_elements(By.CSS_SELECTOR, 'a[href*="/artist/"]')
             artists = []
-            for link in artist_links:
-                name = link.text.strip()
+            for link in row.get("artists") or []:
+                name = link.get("name")
                 if name:
-                    href = link.get_attribute("href") or ""
-                    artist_url = href.split("?")[0] if href else None
-                    artist_id = href.split("/artist/")[-1] if "/artist/" in href else None
+                    href = link.get("href") or ""
+                    artist_url = href.partition("?")[0] if href else None
+                    artist_id = _spotify_id(href, "artist") if href else None
                     artists.append({
                         "name": name,
                         "url": artist_url,
@@ -804,96 +1219,40 @@ class SeleniumSpotifyClient:
             if not artists:
                 artists = [{"name": "Unknown Artist", "url": None, "id": None}]
 
-            # For backwards compatibility, also store as comma-separated string
-            artist_names = [a["name"] for a in artists]
-
-            # Album name and URL
-            album_element = self._first_element(
-                row,
-                [
-                    'a[href*="/album/"]',
-                    '[data-testid="tracklist-row-album-name"]',
-                ],
+            # Album name and URL (only set when the album element is a link)
+            album_name = row.get("album_name")
+            album_href = row.get("album_href") or ""
+            album_url = album_href.partition("?")[0] if "/album/" in album_href else None
+
+            track = TrackRecord(
+                position=position or 0,
+                track_id=track_id or "",
+                track_name=track_name,
+                # For backwards compatibility, also store as comma-separated string
+                artist=", ".join(a["name"] for a in artists),
+                artists=artists,
+                album=album_name,
+                album_url=album_url,
+                duration=row.get("duration"),
+                spotify_url=track_url,
+                explicit=bool(row.get("explicit")),
             )
-            album_name = album_element.text.strip() if album_element else None
-            
-            # Extract album URL if album element is a link
-            album_url = None
-            if album_element:
-                try:
-                    href = album_element.get_attribute("href")
-                    if href and "/album/" in href:
-                        album_url = href.split("?")[0]  # Remove query parameters
-                except Exception:
-                    pass
 
-            # Explicit flag
-            explicit = bool(row.find_elements(By.CSS_SELECTOR, 'span[aria-label="Explicit"]'))
-
-            track = {
-                "position": position or 0,
-                "track_id": track_id or "",
-                "track_name": track_name,
-                "artist": ", ".join(artist_names),  # String for backwards compatibility
-                "artists": artists,  # List with URLs for hyperlinking
-                "album": album_name,
-                "album_url": album_url,  # Album URL for hyperlinking
-                "duration_ms": None,  # Not available via scraping
-                "duration": None,
-                "popularity": None,  # Not available via scraping
-                "spotify_url": track_url,
-                "explicit": explicit,
-            }
-
-            key_parts = [
-                f"{position:04d}" if position else "",
-                track_id or "",
-                track_name,
-            ]
-            key = "|".join(part for part in key_parts if part)
+            # "position|track_id|track_name", omitting whichever of the first two is missing
+            key = f"{track_id}|{track_name}" if track_id else track_name
+            if position:
+                key = f"{position:04d}|{key}"
 
-            return key or track_name, track, position
+            return key, track, position
 
-        except Exception as e:
-            # Stale element or any other error during parsing, skip this row
-            return None
-
-    def _extract_position(self, row) -> Optional[int]:
-        """Extract track position from row"""
-        try:
-            attr = row.get_attribute("aria-rowindex")
-            if attr and attr.isdigit():
-                return int(attr)
         except Exception:
-            # Element became stale, return None
+            # Malformed row data, skip this row
             return None
 
-        selectors = [
-            '[data-testid="tracklist-row-index"]',
-            'span[data-testid="index"]',
-            'span',
-        ]
-        for selector in selectors:
-            try:
-                elems = row.find_elements(By.CSS_SELECTOR, selector)
-                for elem in elems:
-                    try:
-                        text = elem.text.strip()
-                        if text.isdigit():
-                            return int(text)
-                    except Exception:
-                        # Element became stale, continue
-                        continue
-            except Exception:
-                continue
-        return None
-
     @staticmethod
     def _extract_track_id(track_url: str) -> Optional[str]:
         """Extract track ID from Spotify URL"""
-        if "/track/" not in track_url:
-            return None
-        return track_url.split("/track/")[-1]
+        return _spotify_id(track_url, "track")
 
     def _convert_to_standard_format(
         self, raw_tracks: List[Dict], metadata: Dict
@@ -942,18 +1301,33 @@ class SeleniumSpotifyClient:
         *,
         text_contains: Optional[str] = None,
     ):
-        """Find first element matching any of the given selectors"""
-        for selector in selectors:
-            try:
-                element = context.find_element(By.CSS_SELECTOR, selector)
-            except Exception:
-                continue
-            if element is None:
-                continue
-            if text_contains and text_contains not in (element.text or ""):
-                continue
-            return element
-        return None
+        """
+        Find first element matching any of the given selectors
+
+        Selectors are tried in priority order inside one script call, rather than
+        a find_element round-trip (and NoSuchElementException) per selector.
+        """
+        # A WebElement context runs the script through its driver, scoped to itself
+        is_driver = hasattr(context, "execute_script")
+        driver = context if is_driver else context.parent
+        try:
+            return driver.execute_script(
+                """
+                const root = arguments[0] || document;
+                for (const selector of arguments[1]) {
+                    const el = root.querySelector(selector);
+                    if (el && (!arguments[2] || (el.innerText || '').includes(arguments[2]))) {
+                        return el;
+                    }
+                }
+                return null;
+                """,
+                None if is_driver else context,
+                list(selectors),
+                text_contains,
+            )
+        except Exception:
+            return None
 
     def __enter__(self):
         return self
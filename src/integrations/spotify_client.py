@@ -6,10 +6,40 @@ playlist tracks and chart data. The Spotify API is used only to enrich track
 metadata with additional information like album details, preview URLs, and
 popularity scores.
 """
-import spotipy
-from spotipy.oauth2 import SpotifyClientCredentials
-from typing import List, Dict, Optional
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Dict, Optional
 from src.core import config
+from src.utils.cache import ArtistGenreCache, TrackMetadataCache
+from src.utils.helpers import create_process_pool
+
+if TYPE_CHECKING:
+    import requests
+
+LOGGER = logging.getLogger(__name__)
+
+# Extra attempts for a batch request that is still rate limited (HTTP 429)
+# after the HTTP adapter's own retries
+API_RATE_LIMIT_RETRIES = 3
+
+# Concurrent batch requests per enrichment pass, and across all clients in the
+# process (the HTTP session pool holds 20 connections)
+API_MAX_WORKERS = 8
+_API_SEMAPHORE = threading.BoundedSemaphore(API_MAX_WORKERS)
+
+
+def _scrape_playlist_in_process(playlist_id: str, playlist_name: str, headless: bool) -> List[Dict]:
+    """
+    Scrape one playlist in a worker process with its own Chrome session
+
+    Selenium drivers cannot be shared between processes, so each worker builds
+    and closes its own client; only the track dicts cross the process boundary.
+    """
+    from src.integrations.selenium_spotify_client import SeleniumSpotifyClient
+    with SeleniumSpotifyClient(headless=headless) as selenium_client:
+        return selenium_client.get_playlist_tracks(playlist_id, playlist_name)
 
 
 class SpotifyClient:
@@ -26,6 +56,7 @@ class SpotifyClient:
         # Initialize Spotify API client for enrichment (optional)
         self.use_api_enrichment = use_api_enrichment
         self.client = None
+        self._http_session = None
 
         if use_api_enrichment:
             if not config.SPOTIFY_CLIENT_ID or not config.SPOTIFY_CLIENT_SECRET:
@@ -33,18 +64,81 @@ class SpotifyClient:
                 self.use_api_enrichment = False
             else:
                 try:
+                    # spotipy/requests are only loaded when enrichment is actually used
+                    import spotipy
+                    from spotipy.oauth2 import SpotifyClientCredentials
+
+                    # One keep-alive connection pool shared by token refreshes and API calls
+                    self._http_session = self._build_http_session()
                     client_credentials_manager = SpotifyClientCredentials(
                         client_id=config.SPOTIFY_CLIENT_ID,
-                        client_secret=config.SPOTIFY_CLIENT_SECRET
+                        client_secret=config.SPOTIFY_CLIENT_SECRET,
+                        requests_session=self._http_session
+                    )
+                    self.client = spotipy.Spotify(
+                        client_credentials_manager=client_credentials_manager,
+                        requests_session=self._http_session,
+                        requests_timeout=10
                     )
-                    self.client = spotipy.Spotify(client_credentials_manager=client_credentials_manager)
                 except Exception as e:
                     print(f"Warning: Failed to initialize Spotify API: {e}. API enrichment disabled.")
                     self.use_api_enrichment = False
 
+        # Disk caches of API metadata (skip /v1/tracks and /v1/artists lookups on warm runs)
+        self._metadata_cache = None
+        self._genre_cache = None
+        if self.use_api_enrichment and config.CACHE_CONFIG['enabled']:
+            self._metadata_cache = TrackMetadataCache(
+                config.CACHE_CONFIG['path'],
+                static_ttl=config.CACHE_CONFIG['static_ttl_hours'] * 3600,
+                popularity_ttl=config.CACHE_CONFIG['popularity_ttl_hours'] * 3600,
+            )
+            self._genre_cache = ArtistGenreCache(
+                config.CACHE_CONFIG['artist_path'],
+                max_age=config.CACHE_CONFIG['genre_ttl_hours'] * 3600,
+            )
+
         self.headless = headless
         self._selenium_client = None
+        self._playlist_image_cache: Dict[str, Optional[str]] = {}
     
+    @staticmethod
+    def _build_http_session() -> 'requests.Session':
+        """
+        Build a pooled HTTP session for Spotify API calls
+
+        Mirrors spotipy's default retry policy, but with a larger connection
+        pool so concurrent batch requests reuse open TLS connections. urllib3
+        only retries 5xx: 429 is not in status_forcelist, and Retry-After is
+        not honored (urllib3 would otherwise retry any 429 carrying the
+        header), so a rate-limited response and its headers reach _call_api,
+        which does the waiting. Kept on requests rather than an HTTP/2 client:
+        spotipy calls session.request() with requests semantics, and a run
+        makes only a handful of batch calls.
+
+        Returns:
+            Configured requests.Session
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=3,
+            connect=None,
+            read=False,
+            allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+            status=3,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            respect_retry_after_header=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
     def get_playlist_tracks(self, playlist_id: str, playlist_name: Optional[str] = None) -> List[Dict]:
         """
         Fetch all tracks from a Spotify playlist using Selenium scraping
@@ -63,22 +157,55 @@ class SpotifyClient:
         tracks = self._get_playlist_tracks_selenium(playlist_id, playlist_name)
 
         # ENRICHMENT: Use Spotify API to add metadata for each track
+        return self._enrich_playlist_tracks(tracks, playlist_id)
+
+    def _enrich_playlist_tracks(self, tracks: List[Dict], playlist_id: str) -> List[Dict]:
+        """
+        Enrich scraped playlist tracks with Spotify API metadata
+
+        Args:
+            tracks: Tracks scraped by Selenium for a single playlist
+            playlist_id: Spotify playlist ID (used for the playlist image fallback)
+
+        Returns:
+            Enriched tracks (unchanged if API enrichment is disabled)
+        """
         if self.use_api_enrichment and self.client:
             print(f"Enriching {len(tracks)} tracks with Spotify API metadata...")
             tracks = self._enrich_tracks_with_api(tracks)
             
             # Playlist image is already included from Selenium scraping, but try API as fallback
             if not tracks[0].get('playlist_image') if tracks else None:
-                try:
-                    playlist = self.client.playlist(playlist_id)
-                    if playlist.get('images') and len(playlist['images']) > 0:
-                        playlist_image = playlist['images'][0]['url']
-                        for track in tracks:
-                            track['playlist_image'] = playlist_image
-                except Exception:
-                    pass  # API playlist access not available for editorial playlists
+                playlist_image = self._get_playlist_image(playlist_id)
+                if playlist_image:
+                    for track in tracks:
+                        track['playlist_image'] = playlist_image
 
         return tracks
+
+    def _get_playlist_image(self, playlist_id: str) -> Optional[str]:
+        """
+        Get a playlist's cover URL from the API (memoized per client)
+
+        Only the images field is requested. Misses are memoized too, since
+        editorial playlists return 404 on every call.
+
+        Args:
+            playlist_id: Spotify playlist ID
+
+        Returns:
+            Cover image URL, or None if unavailable
+        """
+        if playlist_id not in self._playlist_image_cache:
+            playlist_image = None
+            try:
+                playlist = self.client.playlist(playlist_id, fields='images')
+                if playlist.get('images'):
+                    playlist_image = playlist['images'][0]['url']
+            except Exception:
+                pass  # API playlist access not available for editorial playlists
+            self._playlist_image_cache[playlist_id] = playlist_image
+        return self._playlist_image_cache[playlist_id]
     
     def get_playlist_name(self, playlist_id: str) -> str:
         """
@@ -94,6 +221,10 @@ class SpotifyClient:
         """
         Fetch playlist tracks using Selenium web scraping
 
+        The Selenium client (and its Chrome session) is created on first use and
+        reused for every playlist; each playlist is a driver.get() on the same
+        browser. The browser is only torn down in close().
+
         Args:
             playlist_id: Spotify playlist ID
             playlist_name: Optional playlist name
@@ -132,6 +263,32 @@ class SpotifyClient:
         enriched_tracks = []
         enriched_count = 0
         failed_count = 0
+        complete_count = 0
+
+        # Serve fresh metadata from the disk cache; popularity only matters if scraping didn't provide it
+        api_tracks = {}
+        missing_ids = []
+        for track in tracks:
+            track_id = track.get('track_id')
+            if not track_id or not self._needs_enrichment(track):
+                continue
+            cached = None
+            if self._metadata_cache:
+                cached = self._metadata_cache.get(track_id, need_popularity=not track.get('popularity'))
+            if cached:
+                api_tracks[track_id] = cached
+            else:
+                missing_ids.append(track_id)
+
+        if self._metadata_cache:
+            print(f"   Metadata cache: {len(api_tracks)} hits, {len(missing_ids)} to fetch")
+
+        # Fetch full track data from Spotify API in batches instead of one call per track
+        fetched_tracks = self._fetch_tracks(missing_ids)
+        api_tracks.update(fetched_tracks)
+        if self._metadata_cache and fetched_tracks:
+            self._metadata_cache.update(fetched_tracks.values())
+            self._metadata_cache.save()
 
         for track in tracks:
             track_id = track.get('track_id')
@@ -141,10 +298,20 @@ class SpotifyClient:
                 enriched_tracks.append(track)
                 continue
 
-            try:
-                # Fetch full track data from Spotify API
-                api_track = self.client.track(track_id)
+            # Nothing for the API to fill in
+            if not self._needs_enrichment(track):
+                complete_count += 1
+                enriched_tracks.append(track)
+                continue
 
+            api_track = api_tracks.get(track_id)
+            if not api_track:
+                LOGGER.warning("Failed to enrich track '%s': no API data returned", track.get('track_name'))
+                failed_count += 1
+                enriched_tracks.append(track)
+                continue
+
+            try:
                 # Enrich with API data (only fill in missing fields)
                 if not track.get('album') and api_track.get('album'):
                     track['album'] = api_track['album']['name']
@@ -184,12 +351,14 @@ class SpotifyClient:
 
             except Exception as e:
                 # If API enrichment fails, keep the scraped data
-                print(f"   Warning: Failed to enrich track '{track.get('track_name')}': {e}")
+                LOGGER.warning("Failed to enrich track '%s': %s", track.get('track_name'), e)
                 failed_count += 1
 
             enriched_tracks.append(track)
 
         print(f"   ✓ Enriched {enriched_count}/{len(tracks)} tracks successfully ({failed_count} failed)")
+        if complete_count:
+            print(f"   {complete_count} tracks already had every field, skipped API lookup")
 
         # Fetch and attach genre data from artist endpoints
         print("   Fetching artist genres...")
@@ -208,6 +377,110 @@ class SpotifyClient:
 
         return enriched_tracks
 
+    @staticmethod
+    def _needs_enrichment(track: Dict) -> bool:
+        """
+        Check whether the API would add anything to a track
+
+        A track needs no lookup when every field filled below is already
+        present, including artist IDs (used for the genre lookup).
+
+        Args:
+            track: Track dictionary
+
+        Returns:
+            True if at least one enrichable field is missing
+        """
+        return not (
+            track.get('album')
+            and track.get('album_url')
+            and track.get('duration_ms')
+            and track.get('popularity') is not None
+            and track.get('album_image')
+            and track.get('release_date')
+            and 'preview_url' in track
+            and all(isinstance(a, dict) and a.get('id') for a in track.get('artists', []))
+        )
+
+    @staticmethod
+    def _call_api(method, *args):
+        """
+        Call a spotipy method, waiting out HTTP 429 responses
+
+        Honors the Retry-After header of the 429 response (the pooled session
+        does not retry 429 itself), otherwise backs off exponentially (1s, 2s, 4s).
+
+        Args:
+            method: Bound spotipy client method (e.g. client.tracks)
+            *args: Arguments for the method
+
+        Returns:
+            The method's response
+        """
+        from spotipy import SpotifyException
+
+        for attempt in range(API_RATE_LIMIT_RETRIES + 1):
+            try:
+                with _API_SEMAPHORE:
+                    return method(*args)
+            except SpotifyException as e:
+                if e.http_status != 429 or attempt == API_RATE_LIMIT_RETRIES:
+                    raise
+                retry_after = (e.headers or {}).get('Retry-After')
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = 2 ** attempt
+                LOGGER.warning("Rate limited by Spotify API, retrying in %.0fs", delay)
+                time.sleep(delay)
+
+    def _fetch_tracks(self, track_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch full track objects for the given IDs using batch API calls.
+
+        Args:
+            track_ids: Spotify track IDs (duplicates are fetched once)
+
+        Returns:
+            Dict mapping track_id to the API track object
+        """
+        unique_ids = list(dict.fromkeys(track_ids))
+        api_tracks = {}
+
+        # Batch fetch (Spotify API supports up to 50 tracks per request)
+        batch_size = 50
+        batches = [unique_ids[i:i + batch_size] for i in range(0, len(unique_ids), batch_size)]
+        for response in self._fetch_batches(self.client.tracks, batches, 'track'):
+            for track_data in response.get('tracks', []):
+                if track_data:
+                    api_tracks[track_data['id']] = track_data
+
+        return api_tracks
+
+    def _fetch_batches(self, method, batches: List[List[str]], label: str) -> List[Dict]:
+        """
+        Run batch API calls concurrently on a thread pool
+
+        Args:
+            method: Bound spotipy batch method (client.tracks or client.artists)
+            batches: ID lists of up to 50 each
+            label: Item name for warning messages
+
+        Returns:
+            Responses of the batches that succeeded (an empty dict for failures)
+        """
+        def fetch(batch):
+            try:
+                return self._call_api(method, batch)
+            except Exception as e:
+                LOGGER.warning("Failed to fetch %s batch: %s", label, e)
+                return {}
+
+        if len(batches) <= 1:
+            return [fetch(batch) for batch in batches]
+        with ThreadPoolExecutor(max_workers=min(API_MAX_WORKERS, len(batches))) as executor:
+            return list(executor.map(fetch, batches))
+
     def _fetch_artist_genres(self, tracks: List[Dict]) -> Dict[str, List[str]]:
         """
         Fetch genres for all unique artists across tracks using batch API calls.
@@ -228,23 +501,39 @@ class SpotifyClient:
         if not artist_ids:
             return {}
 
+        # Serve fresh genres from the disk cache and only fetch the rest
         artist_genres = {}
-        artist_ids_list = list(artist_ids)
+        artist_ids_list = []
+        for artist_id in artist_ids:
+            cached = self._genre_cache.get(artist_id) if self._genre_cache else None
+            if cached is not None:
+                artist_genres[artist_id] = cached
+            else:
+                artist_ids_list.append(artist_id)
+        if self._genre_cache:
+            print(f"   Genre cache: {len(artist_genres)} hits, {len(artist_ids_list)} to fetch")
 
         # Batch fetch (Spotify API supports up to 50 artists per request)
         batch_size = 50
-        for i in range(0, len(artist_ids_list), batch_size):
-            batch = artist_ids_list[i:i + batch_size]
-            try:
-                response = self.client.artists(batch)
-                for artist_data in response.get('artists', []):
-                    if artist_data:
-                        artist_genres[artist_data['id']] = artist_data.get('genres', [])
-            except Exception as e:
-                print(f"   Warning: Failed to fetch genres for artist batch: {e}")
+        batches = [artist_ids_list[i:i + batch_size] for i in range(0, len(artist_ids_list), batch_size)]
+        responses = self._fetch_batches(self.client.artists, batches, 'artist genre')
+        fetched_genres = {}
+        for batch, response in zip(batches, responses):
+            if not response:
+                # Failed batch: record empty genres so the artists still count as looked up
                 for artist_id in batch:
                     if artist_id not in artist_genres:
                         artist_genres[artist_id] = []
+                continue
+            for artist_data in response.get('artists', []):
+                if artist_data:
+                    fetched_genres[artist_data['id']] = artist_data.get('genres', [])
+        artist_genres.update(fetched_genres)
+
+        # Only successful lookups are cached, so failed batches are retried next run
+        if self._genre_cache and fetched_genres:
+            self._genre_cache.update(fetched_genres)
+            self._genre_cache.save()
 
         print(f"   ✓ Fetched genres for {len(artist_genres)}/{len(artist_ids)} unique artists")
         return artist_genres
@@ -260,26 +549,65 @@ class SpotifyClient:
             Combined list of tracks from all playlists
         """
         all_tracks = []
-        
-        for playlist_id in playlist_ids:
-            if not playlist_id:
-                continue
-            try:
-                playlist_name = self.get_playlist_name(playlist_id)
-                tracks = self.get_playlist_tracks(playlist_id, playlist_name)
+        playlist_ids = [playlist_id for playlist_id in playlist_ids if playlist_id]
+        workers = min(config.SCRAPER_CONFIG['playlist_workers'], len(playlist_ids))
+
+        # By default Selenium drives a single browser and playlists are scraped one
+        # at a time; with SCRAPER_WORKERS > 1 each playlist gets its own browser in
+        # a worker process. API enrichment of each playlist runs on a worker thread
+        # while the next playlist is being scraped, overlapping the I/O-bound phases.
+        with ThreadPoolExecutor(max_workers=1) as enrich_executor:
+            pending = []
+            if workers > 1:
+                print(f"Scraping {len(playlist_ids)} playlists in {workers} parallel browser processes...")
+                # Not forked from this process: the Drive warm-up and token threads may hold locks
+                with create_process_pool(
+                    workers, preload=['src.integrations.selenium_spotify_client']
+                ) as scrape_executor:
+                    scrape_futures = [
+                        (playlist_id, scrape_executor.submit(
+                            _scrape_playlist_in_process,
+                            playlist_id, self.get_playlist_name(playlist_id), self.headless
+                        ))
+                        for playlist_id in playlist_ids
+                    ]
+                    for playlist_id, scrape_future in scrape_futures:
+                        try:
+                            tracks = scrape_future.result()
+                            pending.append((playlist_id, enrich_executor.submit(
+                                self._enrich_playlist_tracks, tracks, playlist_id
+                            )))
+                        except Exception as e:
+                            print(f"Error fetching playlist {playlist_id}: {e}")
+            else:
+                for playlist_id in playlist_ids:
+                    try:
+                        playlist_name = self.get_playlist_name(playlist_id)
+                        print(f"Scraping playlist {playlist_id} using Selenium...")
+                        tracks = self._get_playlist_tracks_selenium(playlist_id, playlist_name)
+                        pending.append((playlist_id, enrich_executor.submit(
+                            self._enrich_playlist_tracks, tracks, playlist_id
+                        )))
+                    except Exception as e:
+                        print(f"Error fetching playlist {playlist_id}: {e}")
+                        continue
+
+            for playlist_id, future in pending:
+                try:
+                    tracks = future.result()
 
-                # Store playlist_id on each track for URL generation
-                for track in tracks:
-                    track['playlist_id'] = playlist_id
+                    # Store playlist_id on each track for URL generation
+                    for track in tracks:
+                        track['playlist_id'] = playlist_id
 
-                # Limit tracks per playlist if configured
-                if config.TABLE_CONFIG['max_tracks_per_playlist']:
-                    tracks = tracks[:config.TABLE_CONFIG['max_tracks_per_playlist']]
+                    # Limit tracks per playlist if configured
+                    if config.TABLE_CONFIG['max_tracks_per_playlist']:
+                        tracks = tracks[:config.TABLE_CONFIG['max_tracks_per_playlist']]
 
-                all_tracks.extend(tracks)
-            except Exception as e:
-                print(f"Error fetching playlist {playlist_id}: {e}")
-                continue
+                    all_tracks.extend(tracks)
+                except Exception as e:
+                    print(f"Error fetching playlist {playlist_id}: {e}")
+                    continue
         
         return all_tracks
     
@@ -294,9 +622,11 @@ class SpotifyClient:
         return f"{minutes}:{seconds:02d}"
 
     def close(self):
-        """Close any open Selenium sessions"""
+        """Close any open Selenium sessions and HTTP connections"""
         if self._selenium_client:
             self._selenium_client.close()
+        if self._http_session:
+            self._http_session.close()
 
     def __enter__(self):
         return self
@@ -4,14 +4,19 @@ Dashboard Generator for Cross-Playlist Analytics
 This module generates a combined HTML dashboard that presents analytics
 across all collected playlists, providing insights useful for A&R.
 """
-import os
-import html
+import hashlib
+import heapq
 import json
+import os
+import sys
+from operator import itemgetter
 from typing import List, Dict, Optional
 from datetime import datetime
 from collections import Counter, defaultdict
-from jinja2 import Template
+from markupsafe import Markup, escape
 from src.core import config
+from src.reporting.template_loader import TEMPLATE_DIR, get_template
+from src.utils.helpers import group_tracks_by_playlist
 
 
 class DashboardGenerator:
@@ -19,16 +24,13 @@ class DashboardGenerator:
 
     def __init__(self):
         """Initialize dashboard generator with template path"""
-        template_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            'templates'
-        )
-        self.template_path = os.path.join(template_dir, 'dashboard_template.html')
+        self.template_path = os.path.join(TEMPLATE_DIR, 'dashboard_template.html')
 
     def generate_dashboard(
         self,
         all_tracks: List[Dict],
-        output_path: str
+        output_path: str,
+        skip_if_unchanged: bool = False
     ) -> str:
         """
         Generate HTML dashboard from all collected tracks.
@@ -36,10 +38,28 @@ class DashboardGenerator:
         Args:
             all_tracks: List of all track dictionaries from all playlists
             output_path: Path where HTML should be saved
+            skip_if_unchanged: Keep the existing file when output_path was last
+                rendered from identical tracks, theme, template and generator
+                code (recorded in a .hash sidecar next to it). Only useful for
+                callers that regenerate a fixed path; the kept page shows its
+                original "generated at" time.
 
         Returns:
             Path to the generated HTML file
         """
+        hash_path = f'{output_path}.hash'
+        fingerprint = None
+        if skip_if_unchanged:
+            fingerprint = self._fingerprint(all_tracks)
+            if os.path.exists(output_path) and self._read_fingerprint(hash_path) == fingerprint:
+                return output_path
+        # Drop any old fingerprint first so a new or failed render is never mistaken for a match
+        if os.path.exists(hash_path):
+            os.remove(hash_path)
+
+        # Normalize artists and track keys once for analytics and row rendering
+        all_tracks = self._prepare_tracks(all_tracks)
+
         # Calculate all analytics
         analytics = self._calculate_analytics(all_tracks)
 
@@ -64,11 +84,11 @@ class DashboardGenerator:
             if pl_name and pl_id and pl_name not in playlist_urls:
                 playlist_urls[pl_name] = f'https://open.spotify.com/playlist/{pl_id}'
 
-        # Load and render template
-        with open(self.template_path, 'r') as f:
-            template = Template(f.read())
+        # Compiled once per process and shared across instances
+        template = get_template('dashboard_template.html')
 
-        html_output = template.render(
+        # Stream rendered chunks straight to disk instead of building the whole page in memory
+        stream = template.stream(
             theme=config.SPOTIFY_THEME,
             generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             analytics=analytics,
@@ -76,16 +96,122 @@ class DashboardGenerator:
             tracks_by_playlist=tracks_by_playlist,
             all_tracks=sorted_all_tracks,
             playlist_urls=playlist_urls,
-            format_track_row=self._format_track_row,
-            format_track_row_with_playlist=self._format_track_row_with_playlist
+            track_row=self._format_track_row
         )
+        # Hand the file 64 template chunks at a time instead of one write per chunk
+        stream.enable_buffering(size=64)
 
-        # Save to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_output)
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            stream.dump(f)
 
+        if fingerprint:
+            self._write_fingerprint(hash_path, fingerprint, output_path)
         return output_path
 
+    def _fingerprint(self, all_tracks: List[Dict]) -> str:
+        """
+        Hash the dashboard inputs: the track dicts, the theme, and the template
+        and generator source
+
+        Args:
+            all_tracks: List of all track dictionaries from all playlists
+
+        Returns:
+            Hex digest identifying the rendered content
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(all_tracks, sort_keys=True, default=str).encode('utf-8'))
+        digest.update(json.dumps(config.SPOTIFY_THEME, sort_keys=True).encode('utf-8'))
+        for source_path in (self.template_path, __file__):
+            with open(source_path, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _read_fingerprint(hash_path: str) -> Optional[str]:
+        """Read the fingerprint recorded for a previous render (None if missing or unreadable)"""
+        try:
+            with open(hash_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('hash')
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    @staticmethod
+    def _write_fingerprint(hash_path: str, fingerprint: str, output_path: str):
+        """Record the fingerprint of a finished render next to its output"""
+        try:
+            with open(hash_path, 'w', encoding='utf-8') as f:
+                json.dump({'hash': fingerprint, 'output': output_path}, f)
+        except OSError as e:
+            print(f"   Warning: Failed to save dashboard fingerprint {hash_path}: {e}")
+
+    @staticmethod
+    def _format_track_row(track: Dict, all_tracks: bool = False) -> Markup:
+        """
+        Format one track as a table row from its pre-escaped '_esc' fields
+
+        Args:
+            track: Prepared track dictionary (see _prepare_tracks)
+            all_tracks: Add the data attributes used by the All Tracks tab
+                for client-side filtering and sorting
+
+        Returns:
+            Row HTML, marked safe for the template
+        """
+        get = track.get
+        esc = track['_esc']
+        popularity = get('popularity', 0)
+        explicit = get('explicit')
+
+        if all_tracks:
+            position = get('position')
+            try:
+                position_num = int(position)
+            except (TypeError, ValueError):
+                position_num = 999
+            parts = [
+                f'<tr data-position="{position_num}"'
+                f' data-track="{escape(str(get("track_name", "")).lower())}"'
+                f' data-artist="{escape(str(get("artist", "")).lower())}"'
+                f' data-album="{escape(str(get("album", "")).lower())}"'
+                f' data-playlist="{escape(get("playlist", ""))}"'
+                f' data-duration-ms="{get("duration_ms") or 0}"'
+                f' data-popularity="{popularity}"'
+                f' data-explicit="{"true" if explicit else "false"}"'
+                f' data-genres="{escape(json.dumps(get("genres", [])))}">'
+            ]
+        else:
+            parts = ['<tr>']
+
+        parts.append(f'<td class="position-cell">{get("position", "")}</td><td class="track-cell">')
+        if get('album_image'):
+            parts.append(f'<img src="{esc["album_image"]}" alt="" class="album-thumb" />')
+        if get('spotify_url'):
+            parts.append(f'<div class="track-details"><div class="track-name"><a href="{esc["spotify_url"]}" target="_blank">{esc["track_name"]}</a></div>')
+        else:
+            parts.append(f'<div class="track-details"><div class="track-name">{esc["track_name"]}</div>')
+        parts.append('<div class="artist-name">')
+        if explicit:
+            parts.append('<span class="explicit-badge">E</span>')
+        if esc['artists']:
+            parts.append(', '.join(
+                f'<a href="{url}" target="_blank">{name}</a>' if url else name
+                for name, url in esc['artists']
+            ))
+        elif get('artist'):
+            parts.append(esc['artist'])
+        parts.append('</div></div></td>')
+        if get('album_url'):
+            parts.append(f'<td><a href="{esc["album_url"]}" target="_blank">{esc["album"]}</a></td>')
+        else:
+            parts.append(f'<td>{esc["album"]}</td>')
+        parts.append(
+            f'<td class="duration-cell">{esc["duration"]}</td>'
+            f'<td class="popularity-cell"><div class="pop-container"><span class="pop-value">{popularity}</span>'
+            f'<span class="pop-bar-bg"><span class="pop-bar" style="width: {popularity or 0}%;"></span></span></div></td></tr>'
+        )
+        return Markup(''.join(parts))
+
     def _calculate_analytics(self, tracks: List[Dict]) -> Dict:
         """
         Calculate cross-playlist analytics.
@@ -100,75 +226,232 @@ class DashboardGenerator:
         """
         analytics = {}
 
-        # Summary stats
-        playlists = set(t.get('playlist', '') for t in tracks)
-
-        # Count unique artists across all tracks
-        all_artists = set()
-        for track in tracks:
-            artists = track.get('artists', [])
-            if isinstance(artists, list):
-                for artist in artists:
-                    if isinstance(artist, dict) and artist.get('name'):
-                        all_artists.add(artist.get('name'))
+        # One pass over the tracks feeds every accumulator used below
+        scan = self._scan_tracks(tracks)
 
+        # Summary stats
+        playlists = scan['playlists']
         analytics['summary'] = {
             'total_tracks': len(tracks),
             'total_playlists': len(playlists),
             'playlist_names': sorted(playlists),
-            'unique_tracks': len(set((t.get('track_name'), t.get('artist')) for t in tracks)),
-            'unique_artists': len(all_artists)
+            'unique_tracks': len(scan['track_keys']),
+            'unique_artists': len(scan['artist_counts'])
         }
 
         # Top artists across all playlists
-        artist_data = self._analyze_artists(tracks)
+        artist_data = self._analyze_artists(scan)
         analytics['top_artists'] = artist_data['top_artists']
         analytics['multi_playlist_artists'] = artist_data['multi_playlist_artists']
 
         # Chart overlap analysis
-        analytics['chart_overlap'] = self._analyze_overlap(tracks)
+        analytics['chart_overlap'] = self._analyze_overlap(scan)
 
         # Popularity analysis
-        analytics['popularity_stats'] = self._analyze_popularity(tracks)
+        analytics['popularity_stats'] = self._analyze_popularity(scan)
 
         # Explicit content analysis
-        analytics['explicit_stats'] = self._analyze_explicit(tracks)
+        analytics['explicit_stats'] = self._analyze_explicit(scan)
 
         # Genre analysis
-        analytics['genre_stats'] = self._analyze_genres(tracks)
+        analytics['genre_stats'] = self._analyze_genres(scan)
 
         # Per-playlist stats
-        analytics['playlist_stats'] = self._analyze_playlists(tracks)
+        analytics['playlist_stats'] = self._analyze_playlists(scan)
 
         return analytics
 
-    def _analyze_artists(self, tracks: List[Dict]) -> Dict:
-        """Analyze artist frequency and multi-playlist presence"""
+    @staticmethod
+    def _prepare_tracks(tracks: List[Dict]) -> List[Dict]:
+        """
+        Return shallow copies of the tracks with precomputed helper fields
+
+        Adds '_artist_pairs' (tuple of (name, url) for each artist dict),
+        '_key' ((track_name, artist)), '_playlist' (interned playlist name,
+        '' if missing), '_position' (999 if missing) and '_songs_chart'
+        ('usa' / 'global' for the Top Songs charts, else None), so analytics and row formatting don't re-parse
+        the artists list or re-read these fields per visit. '_esc' holds the
+        HTML-escaped (Markup) display fields: a track shown in its playlist
+        tab and in All Tracks is escaped once instead of per row. Copies keep
+        the caller's dicts untouched (they may still be on their way to the
+        PDF workers).
+        """
+        prepared = []
+        songs_charts = {}  # playlist name -> chart classification, tested once per playlist
+        for track in tracks:
+            artists = track.get('artists', [])
+            if not isinstance(artists, list):
+                artists = []
+            artist_pairs = tuple(
+                (artist.get('name', ''), artist.get('url', ''))
+                for artist in artists if isinstance(artist, dict)
+            )
+            get = track.get
+            playlist = sys.intern(get('playlist', ''))
+            songs_chart = songs_charts.get(playlist, False)
+            if songs_chart is False:
+                if 'USA' in playlist and 'Songs' in playlist:
+                    songs_chart = 'usa'
+                elif 'Global' in playlist and 'Songs' in playlist:
+                    songs_chart = 'global'
+                else:
+                    songs_chart = None
+                songs_charts[playlist] = songs_chart
+            prepared.append({
+                **track,
+                '_artist_pairs': artist_pairs,
+                '_key': (get('track_name', ''), get('artist', '')),
+                '_playlist': playlist,
+                '_position': get('position', 999),
+                '_songs_chart': songs_chart,
+                '_esc': {
+                    'track_name': escape(get('track_name', '')),
+                    'spotify_url': escape(get('spotify_url', '')),
+                    'album': escape(get('album', '')),
+                    'album_url': escape(get('album_url', '')),
+                    'album_image': escape(get('album_image', '')),
+                    'duration': escape(get('duration', '')),
+                    'artist': escape(get('artist', '')),
+                    'artists': tuple(
+                        (escape(name), escape(url) if url else '') for name, url in artist_pairs
+                    ),
+                },
+            })
+        return prepared
+
+    def _scan_tracks(self, tracks: List[Dict]) -> Dict:
+        """
+        Group everything the cross-playlist analytics need in a single pass
+
+        Replaces one scan per analysis (plus one filtered scan per playlist)
+        with hash-based accumulators; the _analyze_* methods only derive
+        results from them.
+        """
+        playlists = {}
         artist_counts = Counter()
         artist_playlists = defaultdict(set)
         artist_urls = {}
         artist_tracks = defaultdict(list)
+        genre_counts = Counter()
+        genre_playlists = defaultdict(set)
+        genre_tracks = defaultdict(list)
+        track_playlists = defaultdict(list)
+        track_data = {}
+        usa_songs = set()
+        global_songs = set()
+        songs_data = {}
+        track_keys = set()
+        all_pops = []
+        popular_tracks = []
+        total_explicit = 0
 
         for track in tracks:
-            playlist = track.get('playlist', 'Unknown')
-            artists = track.get('artists', [])
+            get = track.get
+            playlist = track['_playlist']
+            # Tracks without a playlist key are listed as 'Unknown' under artists and
+            # genres, and add an empty '' playlist entry without being counted in it
+            # (the same results as the per-analysis scans this replaced)
+            has_playlist = 'playlist' in track
+            label = playlist if has_playlist else 'Unknown'
+            popularity = get('popularity')
+            explicit = get('explicit')
+            # Fields repeated in every artist/genre entry, read once per track
+            track_name = get('track_name', '')
+            spotify_url = get('spotify_url', '')
+            listed_popularity = get('popularity', 0)
+
+            # Per-playlist counters
+            stats = playlists.get(playlist)
+            if stats is None:
+                stats = playlists[playlist] = {
+                    'count': 0, 'explicit': 0, 'pops': [], 'top_track': None, 'top_pop': -1
+                }
+            if explicit:
+                total_explicit += 1
+            if popularity:
+                all_pops.append(popularity)
+                popular_tracks.append(track)
+            if has_playlist:
+                stats['count'] += 1
+                if explicit:
+                    stats['explicit'] += 1
+                if popularity:
+                    stats['pops'].append(popularity)
+                if (popularity or 0) > stats['top_pop']:
+                    stats['top_pop'] = popularity or 0
+                    stats['top_track'] = track
+
+            key = track['_key']
+            track_keys.add(key)
+
+            # Artists and genres
+            for name, url in track['_artist_pairs']:
+                if name:
+                    artist_counts[name] += 1
+                    artist_playlists[name].add(label)
+                    if url and name not in artist_urls:
+                        artist_urls[name] = url
+                    artist_tracks[name].append({
+                        'track_name': track_name,
+                        'playlist': label,
+                        'spotify_url': spotify_url,
+                        'popularity': listed_popularity
+                    })
+
+            for genre in get('genres', []):
+                if genre:
+                    genre_counts[genre] += 1
+                    genre_playlists[genre].add(label)
+                    genre_tracks[genre].append({
+                        'track_name': track_name,
+                        'artist': get('artist', ''),
+                        'playlist': label,
+                        'spotify_url': spotify_url,
+                        'popularity': listed_popularity
+                    })
+
+            # Chart overlap: track key -> list of playlists it appears on
+            track_playlists[key].append({
+                'playlist': playlist,
+                'position': get('position', 0)
+            })
+            if key not in track_data:
+                track_data[key] = track
+
+            # USA vs Global comparison for Songs
+            songs_chart = track['_songs_chart']
+            if songs_chart:
+                (usa_songs if songs_chart == 'usa' else global_songs).add(key)
+                if key not in songs_data:
+                    songs_data[key] = track
+
+        return {
+            'total_tracks': len(tracks),
+            'total_explicit': total_explicit,
+            'playlists': playlists,
+            'track_keys': track_keys,
+            'all_pops': all_pops,
+            'popular_tracks': popular_tracks,
+            'artist_counts': artist_counts,
+            'artist_playlists': artist_playlists,
+            'artist_urls': artist_urls,
+            'artist_tracks': artist_tracks,
+            'genre_counts': genre_counts,
+            'genre_playlists': genre_playlists,
+            'genre_tracks': genre_tracks,
+            'track_playlists': track_playlists,
+            'track_data': track_data,
+            'usa_songs': usa_songs,
+            'global_songs': global_songs,
+            'songs_data': songs_data,
+        }
 
-            if isinstance(artists, list):
-                for artist in artists:
-                    if isinstance(artist, dict):
-                        name = artist.get('name', '')
-                        url = artist.get('url', '')
-                        if name:
-                            artist_counts[name] += 1
-                            artist_playlists[name].add(playlist)
-                            if url and name not in artist_urls:
-                                artist_urls[name] = url
-                            artist_tracks[name].append({
-                                'track_name': track.get('track_name', ''),
-                                'playlist': playlist,
-                                'spotify_url': track.get('spotify_url', ''),
-                                'popularity': track.get('popularity', 0)
-                            })
+    def _analyze_artists(self, scan: Dict) -> Dict:
+        """Analyze artist frequency and multi-playlist presence"""
+        artist_counts = scan['artist_counts']
+        artist_playlists = scan['artist_playlists']
+        artist_urls = scan['artist_urls']
+        artist_tracks = scan['artist_tracks']
 
         # Top 20 artists
         top_artists = []
@@ -182,45 +465,33 @@ class DashboardGenerator:
                 'tracks': artist_tracks.get(name, [])
             })
 
-        # Artists on 3+ playlists
-        multi_playlist = [
-            {
-                'name': name,
-                'count': artist_counts[name],
-                'playlists': len(playlists),
-                'playlist_names': sorted(playlists),
-                'url': artist_urls.get(name, ''),
-                'tracks': artist_tracks.get(name, [])
-            }
-            for name, playlists in artist_playlists.items()
-            if len(playlists) >= 3
-        ]
-        multi_playlist.sort(key=lambda x: (-x['playlists'], -x['count']))
+        # Top 10 artists on 3+ playlists (partial sort; only the winners are materialized)
+        multi_playlist = heapq.nlargest(
+            10,
+            ((name, playlists) for name, playlists in artist_playlists.items() if len(playlists) >= 3),
+            key=lambda item: (len(item[1]), artist_counts[item[0]])
+        )
 
         return {
             'top_artists': top_artists,
-            'multi_playlist_artists': multi_playlist[:10]
+            'multi_playlist_artists': [
+                {
+                    'name': name,
+                    'count': artist_counts[name],
+                    'playlists': len(playlists),
+                    'playlist_names': sorted(playlists),
+                    'url': artist_urls.get(name, ''),
+                    'tracks': artist_tracks.get(name, [])
+                }
+                for name, playlists in multi_playlist
+            ]
         }
 
-    def _analyze_genres(self, tracks: List[Dict]) -> Dict:
+    def _analyze_genres(self, scan: Dict) -> Dict:
         """Analyze genre frequency and cross-playlist presence"""
-        genre_counts = Counter()
-        genre_playlists = defaultdict(set)
-        genre_tracks = defaultdict(list)
-
-        for track in tracks:
-            playlist = track.get('playlist', 'Unknown')
-            for genre in track.get('genres', []):
-                if genre:
-                    genre_counts[genre] += 1
-                    genre_playlists[genre].add(playlist)
-                    genre_tracks[genre].append({
-                        'track_name': track.get('track_name', ''),
-                        'artist': track.get('artist', ''),
-                        'playlist': playlist,
-                        'spotify_url': track.get('spotify_url', ''),
-                        'popularity': track.get('popularity', 0)
-                    })
+        genre_counts = scan['genre_counts']
+        genre_playlists = scan['genre_playlists']
+        genre_tracks = scan['genre_tracks']
 
         top_genres = []
         for genre, count in genre_counts.most_common(20):
@@ -237,25 +508,13 @@ class DashboardGenerator:
             'total_unique_genres': len(genre_counts)
         }
 
-    def _analyze_overlap(self, tracks: List[Dict]) -> Dict:
+    def _analyze_overlap(self, scan: Dict) -> Dict:
         """Analyze track overlap between charts"""
-        # Track key -> list of playlists it appears on
-        track_playlists = defaultdict(list)
-        track_data = {}
-
-        for track in tracks:
-            key = (track.get('track_name', ''), track.get('artist', ''))
-            playlist = track.get('playlist', '')
-            track_playlists[key].append({
-                'playlist': playlist,
-                'position': track.get('position', 0)
-            })
-            if key not in track_data:
-                track_data[key] = track
+        track_data = scan['track_data']
 
         # Find tracks on multiple playlists
         overlap_tracks = []
-        for key, appearances in track_playlists.items():
+        for key, appearances in scan['track_playlists'].items():
             if len(appearances) > 1:
                 track = track_data[key]
                 overlap_tracks.append({
@@ -267,23 +526,11 @@ class DashboardGenerator:
                     'num_charts': len(appearances)
                 })
 
-        overlap_tracks.sort(key=lambda x: -x['num_charts'])
 
         # USA vs Global comparison for Songs
-        usa_songs = set()
-        global_songs = set()
-        songs_data = {}
-        for track in tracks:
-            key = (track.get('track_name', ''), track.get('artist', ''))
-            playlist = track.get('playlist', '')
-            if 'USA' in playlist and 'Songs' in playlist:
-                usa_songs.add(key)
-                if key not in songs_data:
-                    songs_data[key] = track
-            elif 'Global' in playlist and 'Songs' in playlist:
-                global_songs.add(key)
-                if key not in songs_data:
-                    songs_data[key] = track
+        usa_songs = scan['usa_songs']
+        global_songs = scan['global_songs']
+        songs_data = scan['songs_data']
 
         usa_only = usa_songs - global_songs
         global_only = global_songs - usa_songs
@@ -302,7 +549,7 @@ class DashboardGenerator:
             return result
 
         return {
-            'multi_chart_tracks': overlap_tracks[:20],
+            'multi_chart_tracks': heapq.nlargest(20, overlap_tracks, key=itemgetter('num_charts')),
             'usa_global_comparison': {
                 'usa_only': len(usa_only),
                 'global_only': len(global_only),
@@ -315,9 +562,9 @@ class DashboardGenerator:
             }
         }
 
-    def _analyze_popularity(self, tracks: List[Dict]) -> Dict:
+    def _analyze_popularity(self, scan: Dict) -> Dict:
         """Analyze popularity distribution"""
-        all_pops = [t.get('popularity', 0) for t in tracks if t.get('popularity')]
+        all_pops = scan['all_pops']
 
         stats = {
             'overall': {
@@ -329,10 +576,8 @@ class DashboardGenerator:
         }
 
         # By playlist
-        playlists = set(t.get('playlist', '') for t in tracks)
-        for playlist in playlists:
-            pops = [t.get('popularity', 0) for t in tracks
-                    if t.get('playlist') == playlist and t.get('popularity')]
+        for playlist, playlist_stats in scan['playlists'].items():
+            pops = playlist_stats['pops']
             if pops:
                 stats['by_playlist'][playlist] = {
                     'avg': sum(pops) / len(pops),
@@ -341,19 +586,15 @@ class DashboardGenerator:
                 }
 
         # Top 10 most popular tracks
-        sorted_by_pop = sorted(
-            [t for t in tracks if t.get('popularity')],
-            key=lambda x: -x.get('popularity', 0)
-        )
-        stats['top_tracks'] = sorted_by_pop[:10]
+        stats['top_tracks'] = heapq.nlargest(10, scan['popular_tracks'], key=itemgetter('popularity'))
 
         return stats
 
-    def _analyze_explicit(self, tracks: List[Dict]) -> Dict:
+    def _analyze_explicit(self, scan: Dict) -> Dict:
         """Analyze explicit content distribution"""
         stats = {
-            'total_explicit': sum(1 for t in tracks if t.get('explicit')),
-            'total_tracks': len(tracks),
+            'total_explicit': scan['total_explicit'],
+            'total_tracks': scan['total_tracks'],
             'percentage': 0,
             'by_playlist': {}
         }
@@ -362,11 +603,9 @@ class DashboardGenerator:
             stats['percentage'] = (stats['total_explicit'] / stats['total_tracks']) * 100
 
         # By playlist
-        playlists = set(t.get('playlist', '') for t in tracks)
-        for playlist in playlists:
-            playlist_tracks = [t for t in tracks if t.get('playlist') == playlist]
-            explicit = sum(1 for t in playlist_tracks if t.get('explicit'))
-            total = len(playlist_tracks)
+        for playlist, playlist_stats in scan['playlists'].items():
+            explicit = playlist_stats['explicit']
+            total = playlist_stats['count']
             stats['by_playlist'][playlist] = {
                 'explicit': explicit,
                 'total': total,
@@ -375,20 +614,17 @@ class DashboardGenerator:
 
         return stats
 
-    def _analyze_playlists(self, tracks: List[Dict]) -> Dict:
+    def _analyze_playlists(self, scan: Dict) -> Dict:
         """Generate per-playlist statistics"""
         stats = {}
-        playlists = set(t.get('playlist', '') for t in tracks)
-
-        for playlist in playlists:
-            playlist_tracks = [t for t in tracks if t.get('playlist') == playlist]
-            pops = [t.get('popularity', 0) for t in playlist_tracks if t.get('popularity')]
 
+        for playlist, playlist_stats in scan['playlists'].items():
+            pops = playlist_stats['pops']
             stats[playlist] = {
-                'track_count': len(playlist_tracks),
-                'explicit_count': sum(1 for t in playlist_tracks if t.get('explicit')),
+                'track_count': playlist_stats['count'],
+                'explicit_count': playlist_stats['explicit'],
                 'avg_popularity': sum(pops) / len(pops) if pops else 0,
-                'top_track': max(playlist_tracks, key=lambda x: x.get('popularity') or 0) if playlist_tracks else None
+                'top_track': playlist_stats['top_track']
             }
 
         return stats
@@ -403,21 +639,17 @@ class DashboardGenerator:
         artist_tracks = defaultdict(list)
 
         for track in tracks:
-            artists = track.get('artists', [])
-            if isinstance(artists, list):
-                for artist in artists:
-                    if isinstance(artist, dict):
-                        name = artist.get('name', '')
-                        url = artist.get('url', '')
-                        if name:
-                            artist_counts[name] += 1
-                            if url and name not in artist_urls:
-                                artist_urls[name] = url
-                            artist_tracks[name].append({
-                                'track_name': track.get('track_name', ''),
-                                'spotify_url': track.get('spotify_url', ''),
-                                'popularity': track.get('popularity', 0)
-                            })
+            get = track.get
+            for name, url in track['_artist_pairs']:
+                if name:
+                    artist_counts[name] += 1
+                    if url and name not in artist_urls:
+                        artist_urls[name] = url
+                    artist_tracks[name].append({
+                        'track_name': get('track_name', ''),
+                        'spotify_url': get('spotify_url', ''),
+                        'popularity': get('popularity', 0)
+                    })
 
         # Summary stats for this playlist
         pops = [t.get('popularity', 0) for t in tracks if t.get('popularity')]
@@ -447,14 +679,15 @@ class DashboardGenerator:
         genre_counts = Counter()
         genre_tracks = defaultdict(list)
         for track in tracks:
-            for genre in track.get('genres', []):
+            get = track.get
+            for genre in get('genres', []):
                 if genre:
                     genre_counts[genre] += 1
                     genre_tracks[genre].append({
-                        'track_name': track.get('track_name', ''),
-                        'artist': track.get('artist', ''),
-                        'spotify_url': track.get('spotify_url', ''),
-                        'popularity': track.get('popularity', 0)
+                        'track_name': get('track_name', ''),
+                        'artist': get('artist', ''),
+                        'spotify_url': get('spotify_url', ''),
+                        'popularity': get('popularity', 0)
                     })
         analytics['top_genres'] = [
             {'name': genre, 'count': count, 'tracks': genre_tracks.get(genre, [])}
@@ -482,16 +715,14 @@ class DashboardGenerator:
 
     def _group_by_playlist(self, tracks: List[Dict]) -> Dict[str, List[Dict]]:
         """Group tracks by playlist name"""
-        grouped = defaultdict(list)
-        for track in tracks:
-            playlist = track.get('playlist', 'Unknown')
-            grouped[playlist].append(track)
+        grouped = group_tracks_by_playlist(tracks, default='Unknown')
 
-        # Sort each playlist by position
-        for playlist in grouped:
-            grouped[playlist].sort(key=lambda x: x.get('position', 999))
+        # Sort each playlist by position (C-level key lookup on the prepared field)
+        by_position = itemgetter('_position')
+        for playlist_tracks in grouped.values():
+            playlist_tracks.sort(key=by_position)
 
-        return dict(grouped)
+        return grouped
 
     def _build_deduplicated_ranked_all_tracks(self, tracks: List[Dict]) -> List[Dict]:
         """
@@ -505,19 +736,24 @@ class DashboardGenerator:
 
         Returns list of unique track dicts with position = computed rank (1, 2, 3, ...).
         """
-        # Per-playlist average popularity (0-100)
-        playlist_avg_pop = {}
+        # Per-playlist average popularity (0-100), summed in one pass
+        pop_totals = defaultdict(lambda: [0, 0])
         for track in tracks:
             pl = track.get('playlist', '')
-            if pl and pl not in playlist_avg_pop:
-                pops = [t.get('popularity', 0) for t in tracks if t.get('playlist') == pl and t.get('popularity')]
-                playlist_avg_pop[pl] = sum(pops) / len(pops) if pops else 0
+            if pl:
+                totals = pop_totals[pl]
+                if track.get('popularity'):
+                    totals[0] += track['popularity']
+                    totals[1] += 1
+        playlist_avg_pop = {
+            pl: total / count if count else 0 for pl, (total, count) in pop_totals.items()
+        }
 
         # Group by unique track: prefer track_id, else (track_name, artist)
         groups = defaultdict(list)
         for track in tracks:
             tid = track.get('track_id', '').strip()
-            key = tid if tid else (track.get('track_name', ''), track.get('artist', ''))
+            key = tid if tid else track['_key']
             groups[key].append(track)
 
         ranked = []
@@ -556,92 +792,19 @@ class DashboardGenerator:
             # Build row: copy canonical track, set rank fields and playlist list for filter
             row = dict(canonical)
             row['position'] = None  # set below after sort
-            row['_composite'] = composite
-            row['_num_charts'] = num_charts
-            row['_avg_position'] = avg_position
             row['popularity'] = track_pop  # show best popularity
             row['playlist'] = ','.join(sorted(set(playlists_seen))) if playlists_seen else ''
-            ranked.append(row)
+            # Precomputed sort key; the trailing index keeps ties in group order
+            ranked.append((-composite, avg_position, -track_pop, len(ranked), row))
 
         # Sort by composite descending, then assign ranks 1, 2, 3, ...
-        ranked.sort(key=lambda t: (-t['_composite'], t['_avg_position'], -t.get('popularity', 0)))
-        for i, row in enumerate(ranked, start=1):
+        ranked.sort()
+        rows = []
+        for i, (*_sort_key, row) in enumerate(ranked, start=1):
             row['position'] = i
-            del row['_composite']
-            del row['_num_charts']
-            del row['_avg_position']
-
-        return ranked
-
-    def _format_track_row(self, track: Dict) -> str:
-        """Format a single track as an HTML table row"""
-        position = track.get('position', '')
-        track_name = html.escape(str(track.get('track_name', '')))
-        track_url = html.escape(str(track.get('spotify_url', ''))) if track.get('spotify_url') else ''
-        album = html.escape(str(track.get('album', '')))
-        album_url = html.escape(str(track.get('album_url', ''))) if track.get('album_url') else ''
-        album_image = html.escape(str(track.get('album_image', ''))) if track.get('album_image') else ''
-        duration = html.escape(str(track.get('duration', '')))
-        popularity = track.get('popularity', 0)
-        is_explicit = track.get('explicit', False)
-
-        # Build artist names with links
-        artist_html = ''
-        artists = track.get('artists', [])
-        if isinstance(artists, list) and artists:
-            artist_links = []
-            for artist in artists:
-                if isinstance(artist, dict):
-                    name = html.escape(str(artist.get('name', '')))
-                    url = html.escape(str(artist.get('url', ''))) if artist.get('url') else ''
-                    if url:
-                        artist_links.append(f'<a href="{url}" target="_blank">{name}</a>')
-                    else:
-                        artist_links.append(name)
-                else:
-                    artist_links.append(html.escape(str(artist)))
-            artist_html = ', '.join(artist_links)
-        elif track.get('artist'):
-            artist_html = html.escape(str(track.get('artist', '')))
-
-        # Add explicit badge
-        explicit_badge = '<span class="explicit-badge">E</span>' if is_explicit else ''
-
-        # Build row HTML
-        row = f'<tr>'
-        row += f'<td class="position-cell">{position}</td>'
-
-        # Track cell with image
-        row += '<td class="track-cell">'
-        if album_image:
-            row += f'<img src="{album_image}" alt="" class="album-thumb" />'
-        row += '<div class="track-details">'
-        if track_url:
-            row += f'<div class="track-name"><a href="{track_url}" target="_blank">{track_name}</a></div>'
-        else:
-            row += f'<div class="track-name">{track_name}</div>'
-        row += f'<div class="artist-name">{explicit_badge}{artist_html}</div>'
-        row += '</div></td>'
-
-        # Album cell
-        if album_url:
-            row += f'<td><a href="{album_url}" target="_blank">{album}</a></td>'
-        else:
-            row += f'<td>{album}</td>'
-
-        # Duration
-        row += f'<td class="duration-cell">{duration}</td>'
-
-        # Popularity with bar
-        pop_width = popularity if popularity else 0
-        row += f'<td class="popularity-cell">'
-        row += f'<div class="pop-container">'
-        row += f'<span class="pop-value">{popularity}</span>'
-        row += f'<span class="pop-bar-bg"><span class="pop-bar" style="width: {pop_width}%;"></span></span>'
-        row += f'</div></td>'
+            rows.append(row)
 
-        row += '</tr>'
-        return row
+        return rows
 
     @staticmethod
     def _build_histogram(pops: list, num_buckets: int = 5) -> list:
@@ -683,98 +846,3 @@ class DashboardGenerator:
             b['pct'] = round(b['count'] / max_count * 100)
 
         return buckets
-
-    def _format_track_row_with_playlist(self, track: Dict) -> str:
-        """Format a single track as an HTML table row for All Tracks (no playlist column)."""
-        position = track.get('position', '')
-        # Ensure numeric position for client-side sort: missing/0 -> 999 so rows sort last
-        position_num = 999
-        if position is not None and position != '':
-            try:
-                position_num = int(position)
-            except (TypeError, ValueError):
-                pass
-        track_name = html.escape(str(track.get('track_name', '')))
-        track_url = html.escape(str(track.get('spotify_url', ''))) if track.get('spotify_url') else ''
-        album = html.escape(str(track.get('album', '')))
-        album_url = html.escape(str(track.get('album_url', ''))) if track.get('album_url') else ''
-        album_image = html.escape(str(track.get('album_image', ''))) if track.get('album_image') else ''
-        duration = html.escape(str(track.get('duration', '')))
-        popularity = track.get('popularity', 0)
-        is_explicit = track.get('explicit', False)
-        playlist = html.escape(str(track.get('playlist', '')))
-
-        # Build artist names with links
-        artist_html = ''
-        artists = track.get('artists', [])
-        if isinstance(artists, list) and artists:
-            artist_links = []
-            for artist in artists:
-                if isinstance(artist, dict):
-                    name = html.escape(str(artist.get('name', '')))
-                    url = html.escape(str(artist.get('url', ''))) if artist.get('url') else ''
-                    if url:
-                        artist_links.append(f'<a href="{url}" target="_blank">{name}</a>')
-                    else:
-                        artist_links.append(name)
-                else:
-                    artist_links.append(html.escape(str(artist)))
-            artist_html = ', '.join(artist_links)
-        elif track.get('artist'):
-            artist_html = html.escape(str(track.get('artist', '')))
-
-        # Add explicit badge
-        explicit_badge = '<span class="explicit-badge">E</span>' if is_explicit else ''
-
-        # Data attributes for client-side filtering and sorting (position must be numeric for sort)
-        artist_text = html.escape(str(track.get('artist', '')).lower())
-        duration_ms = track.get('duration_ms', 0) or 0
-        genres_json = html.escape(json.dumps(track.get('genres', [])))
-
-        # Build row HTML
-        row = (
-            f'<tr'
-            f' data-position="{position_num}"'
-            f' data-track="{html.escape(str(track.get("track_name", "")).lower())}"'
-            f' data-artist="{artist_text}"'
-            f' data-album="{html.escape(str(track.get("album", "")).lower())}"'
-            f' data-playlist="{playlist}"'
-            f' data-duration-ms="{duration_ms}"'
-            f' data-popularity="{popularity}"'
-            f' data-explicit="{"true" if is_explicit else "false"}"'
-            f' data-genres="{genres_json}"'
-            f'>'
-        )
-        row += f'<td class="position-cell">{position}</td>'
-
-        # Track cell with image
-        row += '<td class="track-cell">'
-        if album_image:
-            row += f'<img src="{album_image}" alt="" class="album-thumb" />'
-        row += '<div class="track-details">'
-        if track_url:
-            row += f'<div class="track-name"><a href="{track_url}" target="_blank">{track_name}</a></div>'
-        else:
-            row += f'<div class="track-name">{track_name}</div>'
-        row += f'<div class="artist-name">{explicit_badge}{artist_html}</div>'
-        row += '</div></td>'
-
-        # Album cell
-        if album_url:
-            row += f'<td><a href="{album_url}" target="_blank">{album}</a></td>'
-        else:
-            row += f'<td>{album}</td>'
-
-        # Duration (playlist column removed; filter still uses data-playlist)
-        row += f'<td class="duration-cell">{duration}</td>'
-
-        # Popularity with bar
-        pop_width = popularity if popularity else 0
-        row += f'<td class="popularity-cell">'
-        row += f'<div class="pop-container">'
-        row += f'<span class="pop-value">{popularity}</span>'
-        row += f'<span class="pop-bar-bg"><span class="pop-bar" style="width: {pop_width}%;"></span></span>'
-        row += f'</div></td>'
-
-        row += '</tr>'
-        return row
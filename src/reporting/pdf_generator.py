@@ -5,13 +5,13 @@ This module handles the conversion of HTML reports to PDF format,
 maintaining Spotify theming and styling from the HTML templates.
 """
 import os
-import html
 from typing import List, Dict, Optional
 from datetime import datetime
-from jinja2 import Template
+from markupsafe import escape
 from weasyprint import HTML, CSS
 from weasyprint.text.fonts import FontConfiguration
 from src.core import config
+from src.reporting.template_loader import TEMPLATE_DIR, get_template
 
 
 class PDFGenerator:
@@ -19,11 +19,7 @@ class PDFGenerator:
 
     def __init__(self):
         """Initialize PDF generator with template paths"""
-        template_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            'templates'
-        )
-        self.template_path = os.path.join(template_dir, 'table_template.html')
+        self.template_path = os.path.join(TEMPLATE_DIR, 'table_template.html')
 
     def generate_pdf_from_html(
         self,
@@ -191,11 +187,11 @@ class PDFGenerator:
                 for name, count in top_artists:
                     artist_url = artist_url_map.get(name, '')
                     if artist_url:
-                        escaped_name = html.escape(name)
-                        escaped_url = html.escape(artist_url)
+                        escaped_name = escape(name)
+                        escaped_url = escape(artist_url)
                         artist_links.append(f'<a href="{escaped_url}" target="_blank">{escaped_name}</a> ({count})')
                     else:
-                        escaped_name = html.escape(name)
+                        escaped_name = escape(name)
                         artist_links.append(f"{escaped_name} ({count})")
                 
                 top_artist_str = ', '.join(artist_links)
@@ -242,96 +238,29 @@ class PDFGenerator:
         
         header_html += '</tr></thead>'
         
-        # Build table body
-        body_html = '<tbody>'
+        # Build table body: collect the cells of each row and join once
+        rows = []
         
         for idx, track in enumerate(tracks, start=1):
-            position = track.get('position', idx)
-            preview_url = html.escape(str(track.get('preview_url', ''))) if track.get('preview_url') else ''
-            track_url = html.escape(str(track.get('spotify_url', ''))) if track.get('spotify_url') else ''
-            track_name = html.escape(str(track.get('track_name', 'Unknown Track')))
-            
-            body_html += '<tr>'
-            
             # Position column - just bold number, no play button
-            body_html += '<td class="position-cell">'
-            body_html += f'<span class="position-number">{position}</span>'
-            body_html += '</td>'
+            cells = [f'<td class="position-cell"><span class="position-number">{track.get("position", idx)}</span></td>']
             
             # Track column with hyperlink, album image, and artist names underneath
             if 'track_name' in columns:
-                body_html += '<td>'
-                album_image_url = track.get('album_image', '')
-                
-                # Get artist names for display under track name
-                artist_names_html = ''
-                is_explicit = track.get('explicit', False)
-                artists = track.get('artists', [])
-                if isinstance(artists, list) and len(artists) > 0:
-                    artist_links = []
-                    for artist in artists:
-                        if isinstance(artist, dict):
-                            artist_name = html.escape(str(artist.get('name', '')))
-                            artist_url = html.escape(str(artist.get('url', ''))) if artist.get('url') else ''
-                            if artist_url:
-                                artist_links.append(f'<a href="{artist_url}" target="_blank">{artist_name}</a>')
-                            else:
-                                artist_links.append(artist_name)
-                        else:
-                            artist_links.append(html.escape(str(artist)))
-                    artist_names_html = ', '.join(artist_links)
-                elif track.get('artist'):
-                    # Fallback to string format
-                    artist_names_html = html.escape(str(track.get('artist', '')))
-
-                # Prepend explicit badge if track is explicit
-                if is_explicit and artist_names_html:
-                    artist_names_html = f'<span class="explicit-badge">E</span>{artist_names_html}'
-                
-                # Build track display with album image and track info
-                if album_image_url:
-                    escaped_image_url = html.escape(str(album_image_url))
-                    body_html += '<div class="track-with-image">'
-                    body_html += f'<img src="{escaped_image_url}" alt="Album art" class="album-image" />'
-                    body_html += '<div class="track-info">'
-                    # Track name
-                    if track_url:
-                        body_html += f'<div class="track-name"><a href="{track_url}" target="_blank">{track_name}</a></div>'
-                    else:
-                        body_html += f'<div class="track-name">{track_name}</div>'
-                    # Artist names underneath in lighter gray
-                    if artist_names_html:
-                        body_html += f'<div class="artist-names">{artist_names_html}</div>'
-                    body_html += '</div></div>'
-                else:
-                    # No album image, just track info
-                    body_html += '<div class="track-info">'
-                    if track_url:
-                        body_html += f'<div class="track-name"><a href="{track_url}" target="_blank">{track_name}</a></div>'
-                    else:
-                        body_html += f'<div class="track-name">{track_name}</div>'
-                    if artist_names_html:
-                        body_html += f'<div class="artist-names">{artist_names_html}</div>'
-                    body_html += '</div>'
-                body_html += '</td>'
+                cells.append(f'<td>{self._format_track_cell(track)}</td>')
             
             # Album column with hyperlink
             if 'album' in columns:
-                body_html += '<td>'
-                album_name = html.escape(str(track.get('album', '')))
-                album_url = html.escape(str(track.get('album_url', ''))) if track.get('album_url') else ''
+                album_name = escape(str(track.get('album', '')))
+                album_url = escape(str(track.get('album_url', ''))) if track.get('album_url') else ''
                 if album_url and album_name:
-                    body_html += f'<a href="{album_url}" target="_blank">{album_name}</a>'
-                elif album_name:
-                    body_html += album_name
+                    cells.append(f'<td><a href="{album_url}" target="_blank">{album_name}</a></td>')
                 else:
-                    body_html += 'Unknown Album'
-                body_html += '</td>'
+                    cells.append(f'<td>{album_name or "Unknown Album"}</td>')
             
             # Duration column
             if 'duration' in columns:
-                duration = html.escape(str(track.get('duration', 'N/A')))
-                body_html += f'<td>{duration}</td>'
+                cells.append(f'<td>{escape(str(track.get("duration", "N/A")))}</td>')
             
             # Popularity column with bar (inline layout)
             if 'popularity' in columns:
@@ -340,22 +269,82 @@ class PDFGenerator:
                     popularity_value = int(popularity)
                     popularity_width = (popularity_value / 100) * 100  # Percentage width
                     # Use explicit green color for PDF compatibility
-                    body_html += '<td style="vertical-align: middle;">'
-                    body_html += '<div class="popularity-cell">'
-                    body_html += f'<span class="popularity-value">{popularity_value}</span>'
-                    body_html += '<span class="popularity-bar-container">'
-                    body_html += f'<span class="popularity-bar" style="width: {popularity_width}%; background-color: #1DB954;"></span>'
-                    body_html += '</span>'
-                    body_html += '</div></td>'
+                    cells.append(
+                        '<td style="vertical-align: middle;"><div class="popularity-cell">'
+                        f'<span class="popularity-value">{popularity_value}</span>'
+                        '<span class="popularity-bar-container">'
+                        f'<span class="popularity-bar" style="width: {popularity_width}%; background-color: #1DB954;"></span>'
+                        '</span></div></td>'
+                    )
                 else:
-                    body_html += '<td style="vertical-align: middle;">N/A</td>'
+                    cells.append('<td style="vertical-align: middle;">N/A</td>')
             
-            body_html += '</tr>'
+            rows.append(f'<tr>{"".join(cells)}</tr>')
         
-        body_html += '</tbody>'
+        body_html = f'<tbody>{"".join(rows)}</tbody>'
         
         return f'<table class="spotify-table" id="spotify-charts-table">{header_html}{body_html}</table>'
     
+    @staticmethod
+    def _format_track_cell(track: Dict) -> str:
+        """
+        Format the track cell contents: optional album art, track name link and artist names
+
+        Shared by the with-image and without-image layouts, which only differ
+        in the wrapper around the track info.
+
+        Args:
+            track: Track dictionary
+
+        Returns:
+            HTML string for the inside of the track <td>
+        """
+        track_url = escape(str(track.get('spotify_url', ''))) if track.get('spotify_url') else ''
+        track_name = escape(str(track.get('track_name', 'Unknown Track')))
+
+        # Get artist names for display under track name
+        artist_names_html = ''
+        artists = track.get('artists', [])
+        if isinstance(artists, list) and len(artists) > 0:
+            artist_links = []
+            for artist in artists:
+                if isinstance(artist, dict):
+                    artist_name = escape(str(artist.get('name', '')))
+                    artist_url = escape(str(artist.get('url', ''))) if artist.get('url') else ''
+                    if artist_url:
+                        artist_links.append(f'<a href="{artist_url}" target="_blank">{artist_name}</a>')
+                    else:
+                        artist_links.append(artist_name)
+                else:
+                    artist_links.append(escape(str(artist)))
+            artist_names_html = ', '.join(artist_links)
+        elif track.get('artist'):
+            # Fallback to string format
+            artist_names_html = escape(str(track.get('artist', '')))
+
+        # Prepend explicit badge if track is explicit
+        if track.get('explicit', False) and artist_names_html:
+            artist_names_html = f'<span class="explicit-badge">E</span>{artist_names_html}'
+
+        # Track name, with artist names underneath in lighter gray
+        if track_url:
+            track_info = f'<div class="track-name"><a href="{track_url}" target="_blank">{track_name}</a></div>'
+        else:
+            track_info = f'<div class="track-name">{track_name}</div>'
+        if artist_names_html:
+            track_info += f'<div class="artist-names">{artist_names_html}</div>'
+        track_info = f'<div class="track-info">{track_info}</div>'
+
+        # Album image to the left of the track info
+        album_image_url = track.get('album_image', '')
+        if album_image_url:
+            return (
+                '<div class="track-with-image">'
+                f'<img src="{escape(str(album_image_url))}" alt="Album art" class="album-image" />'
+                f'{track_info}</div>'
+            )
+        return track_info
+
     def _measure_text_width(self, text: str, font_size_em: float) -> float:
         """
         Measure actual rendered width of text using WeasyPrint's layout engine.
@@ -391,7 +380,7 @@ class PDFGenerator:
             </style>
         </head>
         <body>
-            <span class="measure">{html.escape(text)}</span>
+            <span class="measure">{escape(text)}</span>
         </body>
         </html>
         '''
@@ -476,10 +465,8 @@ class PDFGenerator:
         # Calculate dynamic title font sizes based on playlist name length
         spotify_size, playlist_size = self._calculate_title_font_size(playlist_name)
 
-        # Load HTML template
-        with open(self.template_path, 'r') as f:
-            template_content = f.read()
-            template = Template(template_content)
+        # Compiled once per process and shared across instances
+        template = get_template('table_template.html')
 
         # Render template with dynamic font sizes
         html_output = template.render(
@@ -4,8 +4,9 @@ Table generation and formatting with Spotify theming
 import pandas as pd
 from typing import List, Dict, Optional
 from datetime import datetime
-from jinja2 import Template
 from src.core import config
+from src.reporting.template_loader import TEMPLATE_DIR, get_template
+from src.utils.helpers import sanitize_filename
 import os
 
 
@@ -14,8 +15,7 @@ class TableGenerator:
 
     def __init__(self):
         # Template is now in root templates directory
-        template_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'templates')
-        self.template_path = os.path.join(template_dir, 'table_template.html')
+        self.template_path = os.path.join(TEMPLATE_DIR, 'table_template.html')
     
     def generate_html_table(self, tracks: List[Dict]) -> str:
         """
@@ -44,9 +44,8 @@ class TableGenerator:
         df = df.reset_index(drop=True)
         df.index = df.index + 1  # Start numbering from 1
         
-        # Load HTML template
-        with open(self.template_path, 'r') as f:
-            template = Template(f.read())
+        # Compiled once per process and shared across instances
+        template = get_template('table_template.html')
         
         # Prepare data for template
         table_html = df.to_html(
@@ -159,3 +158,25 @@ class TableGenerator:
         pdf_generator = PDFGenerator()
         return pdf_generator.save_pdf_file(tracks, filename, output_dir, playlist_name=playlist_name)
 
+
+def render_playlist_pdf(playlist_name: str, playlist_tracks: List[Dict], timestamp: str) -> str:
+    """
+    Render one playlist PDF named after the playlist and the run timestamp
+
+    Module-level so it can be submitted to a process pool: each worker builds
+    its own TableGenerator, so only the track dicts cross the process boundary.
+
+    Args:
+        playlist_name: Playlist title (used for the report title and filename)
+        playlist_tracks: Tracks of that playlist
+        timestamp: Run timestamp appended to the filename
+
+    Returns:
+        Path to the saved PDF file
+    """
+    pdf_filename = f'{sanitize_filename(playlist_name)}_{timestamp}.pdf'
+    return TableGenerator().generate_pdf(
+        playlist_tracks,
+        pdf_filename,
+        playlist_name=playlist_name
+    )
@@ -0,0 +1,80 @@
+"""
+Shared Jinja2 environment for the report templates
+
+Templates are parsed and compiled once per process and reused by every
+generator instance, instead of re-reading and recompiling the file on each
+render.
+
+With REPORT_CONFIG['precompile_templates'] enabled, templates are loaded from
+a zip of precompiled Python modules (built by running this module), which
+skips the Jinja lexer/parser on a cold start. The zip is only used while it
+is newer than every template, so an edited template is never served stale.
+"""
+import os
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, ModuleLoader, Template
+from src.core import config
+
+TEMPLATE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    'templates'
+)
+COMPILED_TEMPLATES = os.path.join(TEMPLATE_DIR, 'compiled.zip')
+
+
+def _compiled_is_current() -> bool:
+    """Check that the compiled zip exists and no template is newer than it"""
+    try:
+        compiled_mtime = os.path.getmtime(COMPILED_TEMPLATES)
+    except OSError:
+        return False
+    return all(
+        os.path.getmtime(os.path.join(TEMPLATE_DIR, name)) <= compiled_mtime
+        for name in os.listdir(TEMPLATE_DIR)
+        if name.endswith('.html')
+    )
+
+
+def _create_environment() -> Environment:
+    """Build the environment, preferring precompiled templates when enabled"""
+    loader = FileSystemLoader(TEMPLATE_DIR)
+    if config.REPORT_CONFIG['precompile_templates'] and _compiled_is_current():
+        # Fall back to the source files for templates missing from the zip
+        loader = ChoiceLoader([ModuleLoader(COMPILED_TEMPLATES), loader])
+
+    # Same defaults as jinja2.Template (no autoescape); templates don't change during a run
+    return Environment(loader=loader, auto_reload=False, cache_size=-1)
+
+
+_ENV = _create_environment()
+
+
+def get_template(name: str) -> Template:
+    """
+    Get a compiled report template
+
+    Args:
+        name: Template filename inside the templates directory
+
+    Returns:
+        Compiled jinja2 Template (cached by the environment)
+    """
+    return _ENV.get_template(name)
+
+
+def compile_templates(target: str = COMPILED_TEMPLATES) -> str:
+    """
+    Precompile every template into a zip of Python modules
+
+    Args:
+        target: Path of the zip file to write
+
+    Returns:
+        Path of the written zip file
+    """
+    env = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
+    env.compile_templates(target, zip='deflated', ignore_errors=False)
+    return target
+
+
+if __name__ == '__main__':
+    print(f"✓ Compiled templates to: {compile_templates()}")
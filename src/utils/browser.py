@@ -85,7 +85,12 @@ class ChromeDriverManager:
         self._driver = None
 
     def get_driver(self):
-        """Get or create a Chrome WebDriver instance"""
+        """
+        Get or create a Chrome WebDriver instance
+
+        The driver is cached on the manager, so repeated calls (one per playlist)
+        reuse the same browser instead of paying Chrome startup each time.
+        """
         if self._driver is not None:
             return self._driver
 
@@ -128,6 +133,7 @@ class ChromeDriverManager:
             uc_options.add_argument('--window-size=1920,1080')
 
         # Performance optimizations - disable images and CSS for faster loading
+        # (the playlist cover is taken from its <img> src URL, so it needs no download)
         prefs = {
             'profile.managed_default_content_settings.images': 2,  # Disable images
             'profile.managed_default_content_settings.stylesheets': 2,  # Disable CSS
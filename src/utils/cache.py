@@ -0,0 +1,176 @@
+"""
+Disk-backed caches for Spotify API metadata
+
+TrackMetadataCache stores a trimmed copy of each API track object keyed by
+track ID so repeated runs can skip the /v1/tracks lookups. Stable fields
+(album, artists, duration) and the popularity score expire independently,
+since popularity shifts daily while the rest rarely changes.
+
+ArtistGenreCache does the same for artist genres from /v1/artists, which
+overlap heavily between playlists and runs.
+"""
+
+import json
+import os
+import time
+from typing import Dict, Iterable, List, Optional
+
+
+class _JsonFileCache:
+    """Entries of {'fetched_at': ..., ...} persisted to one JSON file"""
+
+    def __init__(self, cache_path: str, max_age: float):
+        """
+        Initialize the cache and load any existing entries from disk
+
+        Args:
+            cache_path: Path of the JSON cache file
+            max_age: Seconds after which entries are dropped when saving
+        """
+        self.cache_path = cache_path
+        self.max_age = max_age
+        self._entries = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load cache entries from disk (empty cache if missing or unreadable)"""
+        if not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"   Warning: Ignoring unreadable metadata cache {self.cache_path}: {e}")
+            return {}
+
+    def save(self):
+        """Write the cache to disk if it has changed (atomic replace)"""
+        if not self._dirty:
+            return
+
+        now = time.time()
+        entries = {
+            key: entry for key, entry in self._entries.items()
+            if now - entry['fetched_at'] <= self.max_age
+        }
+
+        os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.cache_path)
+            self._entries = entries
+            self._dirty = False
+        except OSError as e:
+            print(f"   Warning: Failed to save metadata cache {self.cache_path}: {e}")
+
+
+class TrackMetadataCache(_JsonFileCache):
+    """JSON file cache of Spotify API track metadata with per-field TTLs"""
+
+    def __init__(self, cache_path: str, static_ttl: float, popularity_ttl: float):
+        """
+        Initialize the cache and load any existing entries from disk
+
+        Args:
+            cache_path: Path of the JSON cache file
+            static_ttl: Seconds before album/artist/duration data expires
+            popularity_ttl: Seconds before the popularity score expires
+        """
+        super().__init__(cache_path, max_age=static_ttl)
+        self.static_ttl = static_ttl
+        self.popularity_ttl = popularity_ttl
+
+    def get(self, track_id: str, need_popularity: bool = True) -> Optional[Dict]:
+        """
+        Get cached API track data if it is still fresh
+
+        Args:
+            track_id: Spotify track ID
+            need_popularity: Whether the caller still needs a popularity score;
+                if False, an expired popularity does not invalidate the entry
+
+        Returns:
+            Trimmed API track object, or None on a miss or expired entry
+        """
+        entry = self._entries.get(track_id)
+        if not entry:
+            return None
+
+        age = time.time() - entry['fetched_at']
+        if age > self.static_ttl:
+            return None
+        if need_popularity and age > self.popularity_ttl:
+            return None
+        return entry['track']
+
+    def update(self, api_tracks: Iterable[Dict]):
+        """
+        Store API track objects in the cache
+
+        Args:
+            api_tracks: Full track objects returned by the Spotify API
+        """
+        fetched_at = time.time()
+        for api_track in api_tracks:
+            if not api_track or not api_track.get('id'):
+                continue
+            self._entries[api_track['id']] = {
+                'fetched_at': fetched_at,
+                'track': self._trim(api_track),
+            }
+            self._dirty = True
+
+    @staticmethod
+    def _trim(api_track: Dict) -> Dict:
+        """Keep only the API track fields used for enrichment"""
+        album = api_track.get('album') or {}
+        return {
+            'id': api_track['id'],
+            'duration_ms': api_track.get('duration_ms'),
+            'popularity': api_track.get('popularity'),
+            'preview_url': api_track.get('preview_url'),
+            'external_ids': api_track.get('external_ids', {}),
+            'album': {
+                'name': album.get('name'),
+                'external_urls': album.get('external_urls', {}),
+                'images': album.get('images', [])[:1],
+                'release_date': album.get('release_date'),
+            },
+            'artists': [
+                {'id': artist.get('id'), 'external_urls': artist.get('external_urls', {})}
+                for artist in api_track.get('artists', [])
+            ],
+        }
+
+
+class ArtistGenreCache(_JsonFileCache):
+    """JSON file cache of Spotify artist genres"""
+
+    def get(self, artist_id: str) -> Optional[List[str]]:
+        """
+        Get cached genres for an artist if they are still fresh
+
+        Args:
+            artist_id: Spotify artist ID
+
+        Returns:
+            List of genres (possibly empty), or None on a miss or expired entry
+        """
+        entry = self._entries.get(artist_id)
+        if not entry or time.time() - entry['fetched_at'] > self.max_age:
+            return None
+        return entry['genres']
+
+    def update(self, artist_genres: Dict[str, List[str]]):
+        """
+        Store genres fetched from the API
+
+        Args:
+            artist_genres: Dict mapping artist_id to its genres
+        """
+        fetched_at = time.time()
+        for artist_id, genres in artist_genres.items():
+            self._entries[artist_id] = {'fetched_at': fetched_at, 'genres': list(genres)}
+            self._dirty = True
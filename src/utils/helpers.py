@@ -4,8 +4,15 @@ Utility Helper Functions
 Common helper functions used across the application
 """
 
+import multiprocessing
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence
+
+# Anything other than letters, digits, underscore, hyphen or space (\w follows str.isalnum())
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\- ]')
 
 
 def format_duration(ms: int) -> str:
@@ -44,6 +51,70 @@ def deduplicate_tracks(tracks: List[Dict], key: str = 'track_id') -> List[Dict]:
     return unique_tracks
 
 
+def group_tracks_by_playlist(tracks: List[Dict], default: str = 'Unknown Playlist') -> Dict[str, List[Dict]]:
+    """
+    Group tracks by playlist name in a single pass
+
+    Playlists keep the order in which they first appear in tracks, and each
+    group keeps the tracks' original order.
+
+    Args:
+        tracks: List of track dictionaries
+        default: Playlist name for tracks without one
+
+    Returns:
+        Dict mapping playlist name to its tracks
+    """
+    grouped = defaultdict(list)
+    for track in tracks:
+        grouped[track.get('playlist', default)].append(track)
+    return dict(grouped)
+
+
+def sanitize_filename(name: str) -> str:
+    """
+    Convert a playlist name into a filesystem-safe filename stem
+
+    Unsafe characters become underscores, surrounding whitespace is
+    stripped, and inner spaces are replaced with underscores.
+
+    Args:
+        name: Raw name (e.g. playlist title)
+
+    Returns:
+        Sanitized filename stem (without extension)
+    """
+    return _UNSAFE_FILENAME_CHARS.sub('_', name).strip().replace(' ', '_')
+
+
+def create_process_pool(max_workers: int, preload: Sequence[str] = ()) -> ProcessPoolExecutor:
+    """
+    Create a process pool that is safe to start from a multi-threaded process
+
+    Drive, token-refresh and enrichment threads may be running (and holding
+    OpenSSL, auth or logging locks) when a pool starts; a worker forked from
+    this process would inherit those locks held and could deadlock. Workers
+    are started from a single-threaded forkserver instead (spawn where
+    forkserver is unavailable).
+
+    Args:
+        max_workers: Number of worker processes
+        preload: Modules the forkserver imports once, so workers forked from
+            it don't each import them (only applies when the forkserver is
+            first started; a failed preload falls back to per-worker imports)
+
+    Returns:
+        ProcessPoolExecutor using the forkserver (or spawn) start method
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        if preload:
+            context.set_forkserver_preload(list(preload))
+    else:
+        context = multiprocessing.get_context('spawn')
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+
 def get_timestamp(format: str = '%Y-%m-%d %H:%M:%S') -> str:
     """
     Get current timestamp as formatted string
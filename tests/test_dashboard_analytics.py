@@ -0,0 +1,99 @@
+"""
+Regression tests for the cross-playlist dashboard analytics
+
+fixtures/dashboard_analytics.json holds the output of the original
+per-analysis implementation for TRACKS; the single-pass version must
+produce the same result.
+"""
+import json
+import os
+
+from src.reporting.dashboard_generator import DashboardGenerator
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'dashboard_analytics.json')
+
+USA_SONGS = 'Top Songs - USA'
+GLOBAL_SONGS = 'Top Songs - Global'
+USA_ALBUMS = 'Top Albums - USA'
+GLOBAL_ALBUMS = 'Top Albums - Global'
+
+
+def _track(track_name, artists, playlist, position, popularity, explicit=False, genres=(), **extra):
+    """Build a scraped-and-enriched track dict (artists: list of (name, url))"""
+    track = {
+        'track_name': track_name,
+        'artist': ', '.join(name for name, _url in artists),
+        'artists': [{'name': name, 'url': url} for name, url in artists],
+        'playlist': playlist,
+        'playlist_id': 'pl',
+        'position': position,
+        'popularity': popularity,
+        'explicit': explicit,
+        'genres': list(genres),
+        'track_id': f"id-{track_name.lower().replace(' ', '-')}",
+        'spotify_url': f"https://open.spotify.com/track/{track_name.lower().replace(' ', '')}",
+        'album': f'{track_name} (Album)',
+        'duration': '3:00',
+    }
+    track.update(extra)
+    return track
+
+
+ARTIST_A = ('Artist A', 'https://open.spotify.com/artist/a')
+ARTIST_B = ('Artist B', 'https://open.spotify.com/artist/b')
+ARTIST_C = ('Artist C', '')
+ARTIST_D = ('Artist D', 'https://open.spotify.com/artist/d')
+
+TRACKS = [
+    _track('Anthem', [ARTIST_A], USA_SONGS, 1, 95, genres=['pop']),
+    _track('Anthem', [ARTIST_A], GLOBAL_SONGS, 2, 95, genres=['pop']),
+    _track('Anthem', [ARTIST_A], USA_ALBUMS, 4, 95, genres=['pop']),
+    _track('Bassline', [ARTIST_B, ARTIST_C], USA_SONGS, 2, 80, explicit=True, genres=['hip hop', 'rap']),
+    _track('Cascade', [ARTIST_C], GLOBAL_SONGS, 1, 88, genres=['latin']),
+    _track('Cascade', [ARTIST_C], GLOBAL_ALBUMS, 3, 88, genres=['latin']),
+    _track('Drift', [ARTIST_D], USA_SONGS, 3, None),
+    _track('Echo', [ARTIST_A, ARTIST_D], GLOBAL_ALBUMS, 1, 70, explicit=True, genres=['pop', 'dance']),
+    _track('Fable', [ARTIST_B], USA_ALBUMS, 1, 0, genres=['rap']),
+    _track('Glow', [ARTIST_D], GLOBAL_SONGS, 3, 65, genres=['dance']),
+    _track('Halo', [ARTIST_A], GLOBAL_ALBUMS, 2, 91, genres=['pop']),
+    # Tracks with an empty or missing playlist name
+    _track('Ivory', [ARTIST_B], '', 5, 40, explicit=True, genres=['rap']),
+    {key: value for key, value in _track('Jade', [ARTIST_C], '', 6, 55).items() if key != 'playlist'},
+    # No artists list: the artist string is the only artist information
+    _track('Kite', [], USA_ALBUMS, 2, 60, artist='Solo Artist'),
+]
+
+
+def _plain(value):
+    """Drop the generator's '_' helper fields and convert tuples for comparison with JSON"""
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items() if not key.startswith('_')}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _analytics():
+    generator = DashboardGenerator()
+    return generator._calculate_analytics(generator._prepare_tracks(TRACKS))
+
+
+def test_analytics_match_fixture():
+    with open(FIXTURE_PATH, 'r', encoding='utf-8') as f:
+        expected = json.load(f)
+
+    assert json.loads(json.dumps(_plain(_analytics()))) == expected
+
+
+def test_tracks_without_playlist_name():
+    analytics = _analytics()
+
+    # '' and a missing playlist both report under '', but only '' tracks are counted there
+    assert analytics['summary']['playlist_names'] == ['', GLOBAL_ALBUMS, USA_ALBUMS, GLOBAL_SONGS, USA_SONGS]
+    assert analytics['playlist_stats']['']['track_count'] == 1
+    assert analytics['explicit_stats']['by_playlist'][''] == {'explicit': 1, 'total': 1, 'percentage': 100.0}
+
+    # Artist entries keep '' and label a missing playlist 'Unknown'
+    artist_c = next(a for a in analytics['top_artists'] if a['name'] == 'Artist C')
+    assert artist_c['playlist_names'] == [GLOBAL_ALBUMS, GLOBAL_SONGS, USA_SONGS, 'Unknown']
+
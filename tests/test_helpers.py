@@ -0,0 +1,55 @@
+"""
+Tests for the shared helper functions (src/utils/helpers.py)
+"""
+import pytest
+
+from src.utils.helpers import group_tracks_by_playlist, sanitize_filename
+
+
+@pytest.mark.parametrize('name, expected', [
+    ('Top Songs - USA', 'Top_Songs_-_USA'),
+    ('  Top Albums - Global  ', 'Top_Albums_-_Global'),
+    ('R&B / Soul: Hits!', 'R_B___Soul__Hits_'),
+    ('Éxitos México', 'Éxitos_México'),
+    ('plain_name-1', 'plain_name-1'),
+    ('', ''),
+])
+def test_sanitize_filename(name, expected):
+    assert sanitize_filename(name) == expected
+
+
+def test_sanitize_filename_matches_character_filter():
+    """Same result as the per-character filter the helper replaced"""
+    def character_filter(name):
+        safe_name = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in name)
+        return safe_name.strip().replace(' ', '_')
+
+    for name in ['Top 50 – Global', 'Hits²', 'K-Pop ♥ 2024', 'tab\there', 'A.B,C', '日本 トップ']:
+        assert sanitize_filename(name) == character_filter(name)
+
+
+def test_group_tracks_by_playlist_keeps_order():
+    tracks = [
+        {'track_name': 'a', 'playlist': 'Top Songs - USA'},
+        {'track_name': 'b', 'playlist': 'Top Songs - Global'},
+        {'track_name': 'c', 'playlist': 'Top Songs - USA'},
+        {'track_name': 'd', 'playlist': 'Top Albums - USA'},
+        {'track_name': 'e', 'playlist': 'Top Songs - Global'},
+    ]
+
+    grouped = group_tracks_by_playlist(tracks)
+
+    # Playlists in first-seen order, tracks in input order, same dict objects
+    assert list(grouped) == ['Top Songs - USA', 'Top Songs - Global', 'Top Albums - USA']
+    assert [t['track_name'] for t in grouped['Top Songs - USA']] == ['a', 'c']
+    assert [t['track_name'] for t in grouped['Top Songs - Global']] == ['b', 'e']
+    assert grouped['Top Albums - USA'][0] is tracks[3]
+    assert type(grouped) is dict
+
+
+def test_group_tracks_by_playlist_default_name():
+    tracks = [{'track_name': 'a'}, {'track_name': 'b', 'playlist': ''}]
+
+    assert list(group_tracks_by_playlist(tracks)) == ['Unknown Playlist', '']
+    assert list(group_tracks_by_playlist(tracks, default='Unknown')) == ['Unknown', '']
+    assert group_tracks_by_playlist([]) == {}
@@ -0,0 +1,111 @@
+"""
+Tests for the disk-backed Spotify track metadata cache (src/utils/cache.py)
+"""
+import json
+import os
+
+import pytest
+
+from src.utils import cache
+from src.utils.cache import TrackMetadataCache
+
+STATIC_TTL = 7 * 24 * 3600
+POPULARITY_TTL = 12 * 3600
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for the cache module; set clock[0] to move time"""
+    now = [1_000_000.0]
+    monkeypatch.setattr(cache.time, 'time', lambda: now[0])
+    return now
+
+
+def _api_track(track_id, popularity=50):
+    return {
+        'id': track_id,
+        'name': 'Not cached',
+        'duration_ms': 180000,
+        'popularity': popularity,
+        'preview_url': None,
+        'external_ids': {'isrc': 'USXXX0000001'},
+        'available_markets': ['US', 'GB'],
+        'album': {
+            'name': 'Album',
+            'external_urls': {'spotify': 'https://open.spotify.com/album/x'},
+            'images': [{'url': 'big.jpg'}, {'url': 'small.jpg'}],
+            'release_date': '2024-01-01',
+            'tracks': {'items': []},
+        },
+        'artists': [{'id': 'a1', 'name': 'Artist', 'external_urls': {'spotify': 'https://open.spotify.com/artist/a1'}}],
+    }
+
+
+def _track_cache(tmp_path):
+    return TrackMetadataCache(str(tmp_path / 'tracks.json'), STATIC_TTL, POPULARITY_TTL)
+
+
+def test_get_expires_popularity_before_static_fields(tmp_path, clock):
+    track_cache = _track_cache(tmp_path)
+    track_cache.update([_api_track('t1')])
+
+    assert track_cache.get('t1')['popularity'] == 50
+
+    # Popularity is stale, the rest is still usable
+    clock[0] += POPULARITY_TTL + 1
+    assert track_cache.get('t1') is None
+    assert track_cache.get('t1', need_popularity=False)['duration_ms'] == 180000
+
+    # Everything is stale
+    clock[0] += STATIC_TTL
+    assert track_cache.get('t1', need_popularity=False) is None
+    assert track_cache.get('missing') is None
+
+
+def test_update_keeps_only_enrichment_fields(tmp_path, clock):
+    track_cache = _track_cache(tmp_path)
+    track_cache.update([_api_track('t1'), None, {'name': 'no id'}])
+
+    cached = track_cache.get('t1')
+    assert 'name' not in cached
+    assert 'available_markets' not in cached
+    assert 'tracks' not in cached['album']
+    assert cached['album']['images'] == [{'url': 'big.jpg'}]
+    assert cached['artists'] == [{'id': 'a1', 'external_urls': {'spotify': 'https://open.spotify.com/artist/a1'}}]
+
+
+def test_save_drops_expired_entries_and_replaces_file(tmp_path, clock):
+    track_cache = _track_cache(tmp_path)
+    track_cache.update([_api_track('old')])
+    clock[0] += STATIC_TTL - 10
+    track_cache.update([_api_track('new')])
+    clock[0] += 20
+    track_cache.save()
+
+    cache_path = tmp_path / 'tracks.json'
+    assert set(json.loads(cache_path.read_text())) == {'new'}
+    assert not os.path.exists(f'{cache_path}.tmp')
+
+    reloaded = _track_cache(tmp_path)
+    assert reloaded.get('new', need_popularity=False)['id'] == 'new'
+    assert reloaded.get('old', need_popularity=False) is None
+
+
+def test_save_without_changes_does_not_write(tmp_path, clock):
+    track_cache = _track_cache(tmp_path)
+    track_cache.save()
+    assert not (tmp_path / 'tracks.json').exists()
+
+    track_cache.update([_api_track('t1')])
+    track_cache.save()
+    mtime = os.path.getmtime(tmp_path / 'tracks.json')
+    os.utime(tmp_path / 'tracks.json', (mtime - 100, mtime - 100))
+    track_cache.save()
+    assert os.path.getmtime(tmp_path / 'tracks.json') == mtime - 100
+
+
+def test_unreadable_cache_file_starts_empty(tmp_path, clock):
+    (tmp_path / 'tracks.json').write_text('{not json')
+
+    assert _track_cache(tmp_path).get('t1') is None
+
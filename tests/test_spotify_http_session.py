@@ -0,0 +1,25 @@
+"""
+Tests for the pooled Spotify API session (SpotifyClient._build_http_session)
+"""
+from src.integrations.spotify_client import SpotifyClient
+
+
+def _retry():
+    session = SpotifyClient._build_http_session()
+    return session.get_adapter('https://api.spotify.com/v1/tracks').max_retries
+
+
+def test_rate_limited_responses_are_not_retried_by_urllib3():
+    retry = _retry()
+
+    # 429 must reach _call_api with its Retry-After header
+    assert retry.is_retry('GET', 429, has_retry_after=True) is False
+    assert retry.is_retry('GET', 429, has_retry_after=False) is False
+
+
+def test_server_errors_are_retried():
+    retry = _retry()
+
+    for status in (500, 502, 503, 504):
+        assert retry.is_retry('GET', status) is True
+    assert retry.is_retry('GET', 404) is False
@@ -0,0 +1,78 @@
+"""
+Tests for the Drive write-request TokenBucket (src/integrations/google_drive_client.py)
+"""
+import pytest
+
+from src.integrations import google_drive_client
+from src.integrations.google_drive_client import TokenBucket
+
+
+class FakeClock:
+    """time.monotonic()/time.sleep() pair where sleeping advances the clock"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(google_drive_client.time, 'monotonic', fake.monotonic)
+    monkeypatch.setattr(google_drive_client.time, 'sleep', fake.sleep)
+    return fake
+
+
+def test_burst_then_paced(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    # Empty bucket: wait for one token at 2/s
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+    for _ in range(3):
+        bucket.acquire()
+
+    clock.now += 100
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert len(clock.sleeps) == 1
+
+
+def test_penalize_halves_rate_until_it_expires(clock):
+    bucket = TokenBucket(rate=8, capacity=10)
+
+    bucket.penalize(duration=30)
+    assert bucket.rate == 4
+    bucket.penalize(duration=30)
+    assert bucket.rate == 2
+
+    # The penalty is lifted on the first refill after it expires
+    clock.now += 31
+    bucket.acquire()
+    assert bucket.rate == 8
+
+
+def test_penalize_keeps_at_least_one_request_per_second(clock):
+    bucket = TokenBucket(rate=1.5, capacity=1)
+
+    bucket.penalize()
+    bucket.penalize()
+    assert bucket.rate == 1.0